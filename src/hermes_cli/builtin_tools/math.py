@@ -1,9 +1,67 @@
 """Mathematical calculation tools."""
 
 import math
+from functools import lru_cache
+
 from hermes_cli.tools import tool
 
 
+# Safe namespace with limited functions, built once at module load.
+# eval in 'eval' mode cannot assign names, so sharing the dict across
+# calls is safe.
+_SAFE_GLOBALS = {
+    "__builtins__": {},
+    "sqrt": math.sqrt,
+    "abs": abs,
+    "min": min,
+    "max": max,
+    "pow": pow,
+    "round": round,
+    "sum": sum,
+    "pi": math.pi,
+    "e": math.e,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "log": math.log,
+    "log10": math.log10,
+    "exp": math.exp,
+    "floor": math.floor,
+    "ceil": math.ceil,
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_expr(expression: str):
+    """Compile an expression to a reusable code object.
+
+    Evaluating an already-compiled code object skips the tokenizer,
+    parser and bytecode pipeline on repeats.
+    """
+    return compile(expression, '<calc>', 'eval')
+
+
+@lru_cache(maxsize=1024)
+def _calculate_impl(expression: str) -> tuple:
+    """Evaluate an expression, returning an immutable (ok, value) pair.
+
+    calculate is a pure function of its expression string, so results are
+    memoized: agent loops tend to re-ask the same calculations, and a
+    repeat becomes a dict lookup instead of an eval. The cache is bounded
+    so adversarial input cannot grow it without limit.
+
+    Args:
+        expression: Math expression string
+
+    Returns:
+        (True, result) on success, (False, error message) on failure
+    """
+    try:
+        return (True, eval(_compile_expr(expression), _SAFE_GLOBALS, {}))
+    except Exception as e:
+        return (False, f"Calculation failed: {str(e)}")
+
+
 @tool(
     name="calculate",
     description="Perform mathematical calculations. Supports basic arithmetic, sqrt, abs, min, max, pow, and common math functions.",
@@ -28,30 +86,7 @@ def calculate(expression: str) -> dict:
     Returns:
         Dict with 'result' key or 'error' key
     """
-    # Safe namespace with limited functions
-    safe_dict = {
-        "__builtins__": {},
-        "sqrt": math.sqrt,
-        "abs": abs,
-        "min": min,
-        "max": max,
-        "pow": pow,
-        "round": round,
-        "sum": sum,
-        "pi": math.pi,
-        "e": math.e,
-        "sin": math.sin,
-        "cos": math.cos,
-        "tan": math.tan,
-        "log": math.log,
-        "log10": math.log10,
-        "exp": math.exp,
-        "floor": math.floor,
-        "ceil": math.ceil,
-    }
-
-    try:
-        result = eval(expression, safe_dict, {})
-        return {"result": result}
-    except Exception as e:
-        return {"error": f"Calculation failed: {str(e)}"}
+    ok, value = _calculate_impl(expression)
+    if ok:
+        return {"result": value}
+    return {"error": value}
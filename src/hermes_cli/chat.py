@@ -2,14 +2,90 @@
 
 import json
 import os
+import sqlite3
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+try:
+    # Optional C-accelerated JSON codec; conversation files can hold large
+    # message histories, so the serialize/parse path benefits noticeably.
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize conversation data to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _loads(buf: bytes) -> Dict[str, Any]:
+    """Parse conversation data from JSON bytes.
+
+    This is also the parser behind metadata index refreshes, so cold
+    listings of large directories go through the C decoder when orjson
+    is installed.
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+        # callers can keep catching the stdlib exception type.
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+class _SanitizeTable(dict):
+    """str.translate table mapping disallowed codepoints to '_'.
+
+    Alphanumeric characters (including non-ASCII letters), '-' and '_'
+    map to themselves; everything else maps to '_'. Codepoints outside
+    the prebuilt ASCII range are classified once on first sight and
+    remembered, so translate stays a single C-level pass per name.
+    """
+
+    def __missing__(self, codepoint: int) -> int:
+        char = chr(codepoint)
+        mapped = codepoint if (char.isalnum() or char in ('-', '_')) else 0x5F
+        self[codepoint] = mapped
+        return mapped
+
+
+_SANITIZE_TABLE = _SanitizeTable()
+for _cp in range(128):
+    _SANITIZE_TABLE[_cp]  # noqa: B018 - prebuild the ASCII entries
+del _cp
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_name(name: str) -> str:
+    """Sanitize a conversation name to be filesystem-safe.
+
+    Args:
+        name: Raw conversation name
+
+    Returns:
+        Name with every character that is not alphanumeric, '-' or '_'
+        replaced by '_'
+    """
+    return name.translate(_SANITIZE_TABLE)
+
 
 class ConversationManager:
     """Manages conversational chat sessions with local JSON persistence."""
 
+    __slots__ = (
+        "conversations_dir",
+        "active_session_file",
+        "_meta_cache",
+        "_path_cache",
+        "_loaded_cache",
+        "_index_db",
+    )
+
     def __init__(self, conversations_dir: Optional[Path] = None):
         """Initialize the conversation manager.
 
@@ -23,9 +99,95 @@ class ConversationManager:
         self.conversations_dir = conversations_dir
         self.active_session_file = self.conversations_dir.parent / ".active_session"
 
+        # Metadata cache for list_conversations: filename -> (st_mtime_ns, meta).
+        # Entries are validated against the file's mtime, so files modified
+        # outside this process are transparently re-read.
+        self._meta_cache: Dict[str, tuple] = {}
+
+        # Resolved Path objects per conversation name; every public method
+        # goes through _get_conversation_path, so repeated operations on
+        # the same conversation reuse a single Path.
+        self._path_cache: Dict[str, Path] = {}
+
+        # Full conversation data for files this instance has written:
+        # filename -> (st_mtime_ns, data). Lets rapid consecutive
+        # add_message calls skip re-reading what was just saved.
+        self._loaded_cache: Dict[str, tuple] = {}
+
         # Create conversations directory if it doesn't exist
         self.conversations_dir.mkdir(parents=True, exist_ok=True)
 
+        # Persistent metadata index: seeds the in-memory cache so a fresh
+        # CLI process can list conversations without re-parsing unchanged
+        # files. Purely an accelerator - entries are still validated
+        # against each file's mtime, so it can never serve stale data.
+        self._index_db = self._open_index()
+        self._load_index()
+
+    def _open_index(self) -> Optional[sqlite3.Connection]:
+        """Open (creating if needed) the persistent metadata index.
+
+        Returns:
+            An autocommit sqlite3 connection in WAL mode, or None if the
+            index can't be opened (the manager then runs cache-only)
+        """
+        try:
+            conn = sqlite3.connect(self.conversations_dir / ".index.db", isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS conversations ("
+                "filename TEXT PRIMARY KEY, mtime_ns INTEGER, name TEXT, "
+                "created_at TEXT, updated_at TEXT, model TEXT, message_count INTEGER)"
+            )
+            return conn
+        except sqlite3.Error:
+            return None
+
+    def _load_index(self) -> None:
+        """Seed the in-memory metadata cache from the persistent index."""
+        if self._index_db is None:
+            return
+        try:
+            rows = self._index_db.execute(
+                "SELECT filename, mtime_ns, name, created_at, updated_at, "
+                "model, message_count FROM conversations"
+            )
+            for filename, mtime_ns, name, created_at, updated_at, model, count in rows:
+                self._meta_cache[filename] = (mtime_ns, {
+                    "name": name,
+                    "created_at": created_at,
+                    "updated_at": updated_at,
+                    "model": model,
+                    "message_count": count
+                })
+        except sqlite3.Error:
+            self._index_db = None
+
+    def _index_put(self, filename: str, mtime_ns: int, meta: Dict[str, Any]) -> None:
+        """Write a metadata entry through to the persistent index."""
+        if self._index_db is None:
+            return
+        try:
+            self._index_db.execute(
+                "INSERT OR REPLACE INTO conversations VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (filename, mtime_ns, meta["name"], meta["created_at"],
+                 meta["updated_at"], meta["model"], meta["message_count"])
+            )
+        except sqlite3.Error:
+            self._index_db = None
+
+    def _index_remove(self, filename: str) -> None:
+        """Drop a metadata entry from the persistent index."""
+        if self._index_db is None:
+            return
+        try:
+            self._index_db.execute(
+                "DELETE FROM conversations WHERE filename = ?", (filename,)
+            )
+        except sqlite3.Error:
+            self._index_db = None
+
     def _get_conversation_path(self, name: str) -> Path:
         """Get the file path for a conversation.
 
@@ -35,27 +197,46 @@ class ConversationManager:
         Returns:
             Path to the conversation JSON file
         """
-        # Sanitize the name to be filesystem-safe
-        safe_name = "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in name)
-        return self.conversations_dir / f"{safe_name}.json"
+        conv_path = self._path_cache.get(name)
+        if conv_path is None:
+            conv_path = self.conversations_dir / f"{_sanitize_name(name)}.json"
+            # Prime pathlib's lazily-built string form now; every later
+            # open/stat/replace on the cached Path then reuses it instead
+            # of re-joining the parts on first use.
+            str(conv_path)
+            self._path_cache[name] = conv_path
+        return conv_path
 
     def _ensure_unique_name(self, name: str) -> str:
         """Ensure the conversation name is unique, auto-incrementing if needed.
 
+        Uniqueness is checked against a hash set built from one directory
+        scan, so each candidate probe is an O(1) membership test rather
+        than a stat() round trip.
+
         Args:
             name: Desired conversation name
 
         Returns:
             Unique conversation name (may have -2, -3, etc. appended)
         """
-        original_name = name
+        # Snapshot existing filenames with a single directory scan rather
+        # than issuing one stat() per candidate name.
+        with os.scandir(self.conversations_dir) as entries:
+            existing = {entry.name for entry in entries if entry.name.endswith(".json")}
+
+        filename = self._get_conversation_path(name).name
+        if filename not in existing:
+            return name
+
+        # The sanitizer passes '-' and digits through, so suffixed
+        # candidates can be probed as plain strings against the snapshot.
+        safe_base = filename[:-len(".json")]
         counter = 2
-
-        while self._get_conversation_path(name).exists():
-            name = f"{original_name}-{counter}"
+        while f"{safe_base}-{counter}.json" in existing:
             counter += 1
 
-        return name
+        return f"{name}-{counter}"
 
     def create_conversation(
         self,
@@ -92,11 +273,17 @@ class ConversationManager:
             messages.append({"role": "system", "content": system_prompt})
         messages.append(initial_message)
 
-        # Create conversation metadata
+        # Create conversation metadata, stamping both fields from a single
+        # clock read so created_at and updated_at start out identical.
+        # The whole payload is serialized in one C-level pass at write
+        # time, so splicing a pre-rendered JSON "header" template around
+        # the dynamic fields would save nothing and reintroduce manual
+        # string escaping.
+        now = datetime.now().isoformat()
         conversation_data = {
             "name": unique_name,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "model": model,
             "temperature": temperature,
             "max_tokens": max_tokens,
@@ -107,8 +294,7 @@ class ConversationManager:
 
         # Save to file
         conv_path = self._get_conversation_path(unique_name)
-        with open(conv_path, 'w', encoding='utf-8') as f:
-            json.dump(conversation_data, f, indent=2)
+        self._write_conversation(conv_path, conversation_data)
 
         return unique_name, conv_path
 
@@ -132,23 +318,86 @@ class ConversationManager:
                 f"Use 'hermes chat --name <name>' to create a new conversation."
             )
 
-        with open(conv_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(conv_path, 'rb') as f:
+            return _loads(f.read())
+
+    def _write_conversation(
+        self,
+        conv_path: Path,
+        conversation_data: Dict[str, Any],
+        durable: bool = False
+    ) -> None:
+        """Atomically write conversation data to its file.
+
+        The data is serialized once, written in full to a same-directory
+        temp file and swapped into place with os.replace, so a crash
+        mid-write can never leave a truncated conversation behind.
+
+        Args:
+            conv_path: Target conversation file path
+            conversation_data: Full conversation data to write
+            durable: If True, fsync the temp file before the swap
+        """
+        buf = _dumps(conversation_data)
+        tmp_path = conv_path.with_name(conv_path.name + ".tmp")
 
-    def save_conversation(self, name: str, conversation_data: Dict[str, Any]) -> None:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            # os.write may return a short count (ENOSPC and friends)
+            # without raising; loop until every byte is down so the swap
+            # below can never install a truncated file
+            view = memoryview(buf)
+            while view:
+                view = view[os.write(fd, view):]
+            if durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        os.replace(tmp_path, conv_path)
+        self._remember_meta(conv_path, conversation_data)
+
+    def save_conversation(
+        self,
+        name: str,
+        conversation_data: Dict[str, Any],
+        durable: bool = False
+    ) -> None:
         """Save conversation data to file.
 
         Args:
             name: Name of the conversation
             conversation_data: Full conversation data to save
+            durable: If True, fsync before swapping the file into place
         """
         conv_path = self._get_conversation_path(name)
 
         # Update timestamp
         conversation_data["updated_at"] = datetime.now().isoformat()
 
-        with open(conv_path, 'w', encoding='utf-8') as f:
-            json.dump(conversation_data, f, indent=2)
+        self._write_conversation(conv_path, conversation_data, durable=durable)
+
+    def save_many(
+        self,
+        items: List[tuple],
+        durable: bool = False
+    ) -> None:
+        """Save several conversations in one batch.
+
+        All payloads are serialized up front and stamped with a single
+        shared timestamp, so bulk imports and migrations pay the setup
+        cost once instead of once per conversation.
+
+        Args:
+            items: List of (name, conversation_data) tuples
+            durable: If True, fsync each file before swapping it into place
+        """
+        timestamp = datetime.now().isoformat()
+
+        for name, conversation_data in items:
+            conversation_data["updated_at"] = timestamp
+            conv_path = self._get_conversation_path(name)
+            self._write_conversation(conv_path, conversation_data, durable=durable)
 
     def add_message(
         self,
@@ -163,7 +412,24 @@ class ConversationManager:
             role: Message role (user or assistant)
             content: Message content
         """
-        conversation_data = self.load_conversation(name)
+        conv_path = self._get_conversation_path(name)
+
+        # Reuse the data written by this instance's last save if the file
+        # hasn't changed underneath us, so back-to-back appends skip the
+        # read-and-parse half of the round trip. Writes stay synchronous:
+        # deferring them would break read-your-writes for other processes.
+        conversation_data = None
+        cached = self._loaded_cache.get(conv_path.name)
+        if cached is not None:
+            try:
+                if conv_path.stat().st_mtime_ns == cached[0]:
+                    conversation_data = cached[1]
+            except OSError:
+                pass
+
+        if conversation_data is None:
+            conversation_data = self.load_conversation(name)
+
         conversation_data["messages"].append({
             "role": role,
             "content": content
@@ -182,6 +448,58 @@ class ConversationManager:
         conversation_data = self.load_conversation(name)
         return conversation_data["messages"]
 
+    def iter_messages(self, name: str):
+        """Iterate over the messages of a conversation.
+
+        Suits callers that only walk the history once (rendering,
+        filtering) and don't need the list itself. Note the JSON parse
+        still materializes the messages; this avoids holding an extra
+        reference to the list in caller code, not the parse.
+
+        Args:
+            name: Name of the conversation
+
+        Yields:
+            Message dictionaries in conversation order
+        """
+        yield from self.load_conversation(name)["messages"]
+
+    @staticmethod
+    def _build_meta(data: Dict[str, Any], fallback_name: str) -> Dict[str, Any]:
+        """Build the listing metadata dict for a parsed conversation.
+
+        Args:
+            data: Parsed conversation data
+            fallback_name: Name to use if the data has no 'name' field
+                           (the file stem)
+
+        Returns:
+            Metadata dict as returned by list_conversations
+        """
+        return {
+            "name": data.get("name", fallback_name),
+            "created_at": data.get("created_at", "Unknown"),
+            "updated_at": data.get("updated_at", "Unknown"),
+            "model": data.get("model", "Unknown"),
+            "message_count": len(data.get("messages", []))
+        }
+
+    def _remember_meta(self, conv_path: Path, data: Dict[str, Any]) -> None:
+        """Record caches for a conversation that was just written.
+
+        Args:
+            conv_path: Path the conversation was written to
+            data: Conversation data that was written
+        """
+        try:
+            mtime_ns = conv_path.stat().st_mtime_ns
+        except OSError:
+            return
+        meta = self._build_meta(data, conv_path.stem)
+        self._meta_cache[conv_path.name] = (mtime_ns, meta)
+        self._loaded_cache[conv_path.name] = (mtime_ns, data)
+        self._index_put(conv_path.name, mtime_ns, meta)
+
     def list_conversations(self) -> List[Dict[str, str]]:
         """List all available conversations.
 
@@ -190,23 +508,34 @@ class ConversationManager:
         """
         conversations = []
 
-        for conv_file in self.conversations_dir.glob("*.json"):
-            try:
-                with open(conv_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    conversations.append({
-                        "name": data.get("name", conv_file.stem),
-                        "created_at": data.get("created_at", "Unknown"),
-                        "updated_at": data.get("updated_at", "Unknown"),
-                        "model": data.get("model", "Unknown"),
-                        "message_count": len(data.get("messages", []))
-                    })
-            except (json.JSONDecodeError, KeyError):
-                # Skip malformed conversation files
-                continue
+        # Deliberately no O_DIRECT/posix_fadvise(DONTNEED) on these reads:
+        # conversation files are small and re-listed often, so keeping them
+        # in the page cache is exactly what makes repeat calls cheap.
+        with os.scandir(self.conversations_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+
+                mtime_ns = entry.stat().st_mtime_ns
+                cached = self._meta_cache.get(entry.name)
+                if cached is not None and cached[0] == mtime_ns:
+                    conversations.append(cached[1])
+                    continue
+
+                try:
+                    with open(entry.path, 'rb') as f:
+                        data = _loads(f.read())
+                    meta = self._build_meta(data, entry.name[:-5])
+                except (json.JSONDecodeError, KeyError):
+                    # Skip malformed conversation files
+                    continue
+
+                self._meta_cache[entry.name] = (mtime_ns, meta)
+                self._index_put(entry.name, mtime_ns, meta)
+                conversations.append(meta)
 
         # Sort by most recently updated
-        conversations.sort(key=lambda x: x["updated_at"], reverse=True)
+        conversations.sort(key=itemgetter("updated_at"), reverse=True)
         return conversations
 
     def set_active_session(self, name: str) -> None:
@@ -215,8 +544,12 @@ class ConversationManager:
         Args:
             name: Name of the conversation to set as active
         """
-        with open(self.active_session_file, 'w', encoding='utf-8') as f:
+        # Swap the file into place atomically so a crash mid-write can't
+        # leave a truncated session name behind.
+        tmp_path = self.active_session_file.with_name(".active_session.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             f.write(name)
+        os.replace(tmp_path, self.active_session_file)
 
     def get_active_session(self) -> Optional[str]:
         """Get the currently active conversation session.
@@ -253,7 +586,61 @@ class ConversationManager:
             raise FileNotFoundError(f"Conversation '{name}' not found.")
 
         conv_path.unlink()
+        self._forget_conversation(name, conv_path)
 
         # If this was the active session, clear it
         if self.get_active_session() == name:
             self.clear_active_session()
+
+    def delete_many(self, names: List[str]) -> None:
+        """Delete several conversations in one batch.
+
+        All names are validated up front, then the files are unlinked
+        relative to a single open directory fd where the platform supports
+        it, so the kernel resolves the directory path once for the whole
+        batch instead of once per file.
+
+        Args:
+            names: Names of the conversations to delete
+
+        Raises:
+            FileNotFoundError: If any named conversation doesn't exist
+                               (nothing is deleted in that case)
+        """
+        # Dedupe while keeping order: a repeated name passes the
+        # existence check and would then fail its second unlink
+        # mid-batch, breaking the all-or-nothing contract
+        targets = []
+        for name in dict.fromkeys(names):
+            conv_path = self._get_conversation_path(name)
+            if not conv_path.exists():
+                raise FileNotFoundError(f"Conversation '{name}' not found.")
+            targets.append((name, conv_path))
+
+        if os.unlink in os.supports_dir_fd:
+            dir_fd = os.open(self.conversations_dir, os.O_RDONLY)
+            try:
+                for name, conv_path in targets:
+                    os.unlink(conv_path.name, dir_fd=dir_fd)
+                    self._forget_conversation(name, conv_path)
+            finally:
+                os.close(dir_fd)
+        else:
+            for name, conv_path in targets:
+                conv_path.unlink()
+                self._forget_conversation(name, conv_path)
+
+        if self.get_active_session() in {name for name, _ in targets}:
+            self.clear_active_session()
+
+    def _forget_conversation(self, name: str, conv_path: Path) -> None:
+        """Drop all cached state for a deleted conversation.
+
+        Args:
+            name: Name of the conversation
+            conv_path: Path the conversation was stored at
+        """
+        self._meta_cache.pop(conv_path.name, None)
+        self._loaded_cache.pop(conv_path.name, None)
+        self._path_cache.pop(name, None)
+        self._index_remove(conv_path.name)
@@ -1,10 +1,81 @@
 """JSON schema handling logic."""
 
 import json
-from pathlib import Path
+import os
+import stat
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pydantic import ValidationError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the speed extra
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so the error
+# handling below works unchanged with either parser.
+_loads = json.loads if orjson is None else orjson.loads
+
+if orjson is None:
+    def _dumps_indented(schema: Dict[str, Any]) -> str:
+        return json.dumps(schema, indent=2)
+else:
+    def _dumps_indented(schema: Dict[str, Any]) -> str:
+        # For ASCII schemas orjson's OPT_INDENT_2 output is identical to
+        # json.dumps(indent=2); non-ASCII text stays as raw UTF-8 rather
+        # than \u escapes, which is fine inside a prompt.
+        return orjson.dumps(schema, option=orjson.OPT_INDENT_2).decode()
+
+
+class Schema(dict):
+    """Parsed JSON schema that caches its pretty-printed form.
+
+    Behaves exactly like the plain dict it wraps, so downstream code
+    that indexes, truth-tests or re-serializes the schema is unaffected.
+    The indented serialization embedded in system prompts is computed
+    once on first use and reused for the life of the object.
+
+    Instances are only ever constructed after validate_schema_structure
+    has passed, so holding a Schema is itself proof of validity — warm
+    cache hits in load_schema return one without re-validating.
+    """
+
+    __slots__ = ("_formatted",)
+
+    def __init__(self, parsed: Dict[str, Any]):
+        super().__init__(parsed)
+        self._formatted = None
+
+    @property
+    def formatted(self) -> str:
+        """The schema serialized with 2-space indentation, cached."""
+        if self._formatted is None:
+            self._formatted = _dumps_indented(self)
+        return self._formatted
+
+
+# Static halves of the error messages, built once at import instead of
+# inside each raise site.
+_INVALID_JSON_STRING_HINT = (
+    "Make sure your schema is valid JSON. Example:\n"
+    '  --schema \'{"type": "object", "properties": {"key": {"type": "string"}}}\''
+)
+_INVALID_JSON_FILE_HINT = "Make sure the file contains valid JSON."
+_FILE_NOT_FOUND_HINT = "Make sure the file path is correct and the file exists."
+
+
+def _first_nonspace(s: str) -> int:
+    """Return the index of the first non-whitespace character in s.
+
+    Walks by index instead of allocating a stripped copy; returns len(s)
+    for all-whitespace input.
+    """
+    i = 0
+    n = len(s)
+    while i < n and s[i] in ' \t\n\r':
+        i += 1
+    return i
+
 
 def is_json_string(input_str: str) -> bool:
     """Check if a string is a JSON string or a file path.
@@ -15,8 +86,8 @@ def is_json_string(input_str: str) -> bool:
     Returns:
         True if it looks like a JSON string, False if it looks like a file path
     """
-    stripped = input_str.strip()
-    return stripped.startswith('{') or stripped.startswith('[')
+    i = _first_nonspace(input_str)
+    return i < len(input_str) and (input_str[i] == '{' or input_str[i] == '[')
 
 
 def validate_schema_structure(schema: Dict[str, Any]) -> None:
@@ -28,28 +99,116 @@ def validate_schema_structure(schema: Dict[str, Any]) -> None:
     Raises:
         ValueError: If schema structure is invalid
     """
+    # isinstance, not an exact type check: load_schema returns Schema, a
+    # dict subclass, and it must pass its own module's validator. A
+    # missing root-level "type" field is deliberately allowed.
     if not isinstance(schema, dict):
         raise ValueError("Schema must be a JSON object (dictionary)")
 
-    # Basic JSON Schema validation - check for common fields
-    if "type" not in schema:
-        # It's okay if type is missing at the root level in some schemas
-        # but we should warn about potential issues
-        pass
-
     # Check for obviously invalid schemas
     if not schema:
         raise ValueError("Schema cannot be empty")
 
 
-def load_schema(schema_input: str) -> Dict[str, Any]:
+@lru_cache(maxsize=128)
+def _parse_schema_string(schema_input: str) -> Dict[str, Any]:
+    """Parse and validate an inline JSON schema string, caching the result.
+
+    The CLI tends to be invoked with the same schema string over and over
+    (one schema per session), so repeat calls become a dict lookup instead
+    of a fresh parse + validation walk. Errors are not cached; invalid
+    input re-raises on every call.
+
+    Args:
+        schema_input: Raw JSON schema string
+
+    Returns:
+        Parsed JSON schema as a dictionary (shared across cache hits;
+        callers must not mutate it)
+
+    Raises:
+        ValueError: If schema is invalid JSON or has invalid structure
+    """
+    try:
+        schema = _loads(schema_input)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON schema string: {str(e)}\n{_INVALID_JSON_STRING_HINT}")
+
+    validate_schema_structure(schema)
+    return Schema(schema)
+
+
+def _parse_schema_bytes(data: bytes, path_str: str) -> Dict[str, Any]:
+    """Parse and validate schema bytes read from a file.
+
+    Args:
+        data: Raw file contents
+        path_str: Path the bytes came from, for error messages
+
+    Returns:
+        Parsed JSON schema as a dictionary
+
+    Raises:
+        ValueError: If the bytes are invalid JSON or the schema structure
+            is invalid
+    """
+    try:
+        schema = _loads(data)
+    except json.JSONDecodeError as e:
+        raise ValueError(
+            f"Invalid JSON in schema file '{path_str}': {str(e)}\n{_INVALID_JSON_FILE_HINT}"
+        )
+
+    validate_schema_structure(schema)
+    return Schema(schema)
+
+
+@lru_cache(maxsize=128)
+def _load_schema_file(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Read, parse and validate a schema file, caching the result.
+
+    mtime_ns and size are part of the cache key purely so that an edited
+    file misses the cache and gets re-read; they are not used in the body.
+
+    Args:
+        path_str: Resolved path to the schema file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Parsed JSON schema as a dictionary (shared across cache hits;
+        callers must not mutate it)
+
+    Raises:
+        ValueError: If the file is unreadable, invalid JSON or has
+            invalid structure
+    """
+    try:
+        # Read raw bytes and let the JSON parser own UTF-8 validation;
+        # this avoids a separate text-mode decode pass over the file.
+        with open(path_str, 'rb') as f:
+            data = f.read()
+    except PermissionError:
+        raise ValueError(f"Permission denied reading schema file: {path_str}")
+    except Exception as e:
+        raise ValueError(f"Error reading schema file '{path_str}': {str(e)}")
+
+    return _parse_schema_bytes(data, path_str)
+
+
+def load_schema(schema_input: str, *, _opener=None) -> Dict[str, Any]:
     """Load a JSON schema from a string or file path.
 
     This function intelligently detects whether the input is a JSON string
     (starting with { or [) or a file path, then loads and validates it.
+    Results are cached per input string (and per file mtime/size for
+    paths), so repeated calls with the same schema skip the parse and
+    validation entirely.
 
     Args:
         schema_input: Either a JSON string or path to a JSON file
+        _opener: Test seam: a callable returning a binary file object for
+            a path, used in place of the real filesystem (and its cache)
 
     Returns:
         Parsed JSON schema as a dictionary
@@ -58,50 +217,78 @@ def load_schema(schema_input: str) -> Dict[str, Any]:
         ValueError: If schema is invalid JSON or has invalid structure
         FileNotFoundError: If schema file doesn't exist
     """
-    if not schema_input or not schema_input.strip():
+    # One scan of the leading whitespace settles both the emptiness check
+    # and the JSON-vs-path dispatch; no stripped copy is built. The JSON
+    # parser skips the same leading whitespace itself, so the string is
+    # handed over whole (which also keeps the cache key stable).
+    i = _first_nonspace(schema_input) if schema_input else 0
+    if not schema_input or i == len(schema_input):
         raise ValueError("Schema input cannot be empty")
 
-    # Determine if it's a JSON string or file path
-    if is_json_string(schema_input):
-        # Treat as JSON string
-        try:
-            schema = json.loads(schema_input)
-        except json.JSONDecodeError as e:
-            raise ValueError(
-                f"Invalid JSON schema string: {str(e)}\n"
-                f"Make sure your schema is valid JSON. Example:\n"
-                f'  --schema \'{{"type": "object", "properties": {{"key": {{"type": "string"}}}}}}\''
-            )
-    else:
-        # Treat as file path
-        schema_path = Path(schema_input).expanduser()
-
-        if not schema_path.exists():
-            raise FileNotFoundError(
-                f"Schema file not found: {schema_input}\n"
-                f"Make sure the file path is correct and the file exists."
-            )
-
-        if not schema_path.is_file():
-            raise ValueError(f"Schema path is not a file: {schema_input}")
-
-        try:
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                schema = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(
-                f"Invalid JSON in schema file '{schema_input}': {str(e)}\n"
-                f"Make sure the file contains valid JSON."
-            )
-        except PermissionError:
-            raise ValueError(f"Permission denied reading schema file: {schema_input}")
-        except Exception as e:
-            raise ValueError(f"Error reading schema file '{schema_input}': {str(e)}")
-
-    # Validate the schema structure
-    validate_schema_structure(schema)
+    if schema_input[i] == '{' or schema_input[i] == '[':
+        return _parse_schema_string(schema_input)
+
+    if _opener is not None:
+        resolved = os.path.expanduser(schema_input)
+        with _opener(resolved) as f:
+            return _parse_schema_bytes(f.read(), resolved)
 
-    return schema
+    # Treat as file path. One os.stat answers existence, kind and the
+    # cache-key fields in a single syscall, with no Path object built.
+    resolved = os.path.expanduser(schema_input)
+    try:
+        st = os.stat(resolved)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(
+            f"Schema file not found: {schema_input}\n{_FILE_NOT_FOUND_HINT}"
+        )
+    except PermissionError:
+        # e.g. a parent directory without search permission; same
+        # friendly error the file-level read path raises
+        raise ValueError(f"Permission denied reading schema file: {schema_input}")
+
+    if not stat.S_ISREG(st.st_mode):
+        raise ValueError(f"Schema path is not a file: {schema_input}")
+
+    return _load_schema_file(resolved, st.st_mtime_ns, st.st_size)
+
+
+# Instruction text prepended to the formatted schema in system prompts,
+# interned once per process instead of being rebuilt per call.
+_SCHEMA_INSTRUCTION_PREFIX = "You must respond with valid JSON matching this schema: "
+
+# One-slot memo for the pretty-printed schema: (schema object, formatted
+# string). The CLI uses a single schema dict per session, so keying on
+# object identity gives a guaranteed hit after the first turn. Keeping a
+# strong reference to the dict means its id cannot be recycled while the
+# entry is alive.
+_last_formatted = (None, "")
+
+
+def _format_schema(schema: Dict[str, Any]) -> str:
+    """Return the schema pretty-printed with 2-space indentation.
+
+    Repeated calls with the same schema object (the common case: one
+    schema per CLI session) reuse the previous serialization instead of
+    re-running the pretty-printer.
+
+    Args:
+        schema: JSON schema dictionary
+
+    Returns:
+        Indented JSON string for embedding in the system prompt
+    """
+    if type(schema) is Schema:
+        return schema.formatted
+
+    global _last_formatted
+    cached_schema, cached_text = _last_formatted
+    if cached_schema is schema:
+        return cached_text
+
+    text = _dumps_indented(schema)
+    _last_formatted = (schema, text)
+    return text
 
 
 def build_system_prompt_with_schema(
@@ -124,14 +311,16 @@ def build_system_prompt_with_schema(
     """
     # Format schema as compact JSON for shorter prompts, or indented for readability
     # Using indent=2 for better readability in the prompt
-    schema_json = json.dumps(schema, indent=2)
-    schema_instruction = f"\n\nYou must respond with valid JSON matching this schema: {schema_json}"
+    schema_json = _format_schema(schema)
 
+    # A single join builds the result in one pass with no intermediate
+    # strings; the separator stays the \n\n the spec pins down.
     if user_system_prompt:
-        return user_system_prompt + schema_instruction
+        parts = (user_system_prompt, "\n\n", _SCHEMA_INSTRUCTION_PREFIX, schema_json)
     else:
-        # If no user system prompt, just use the schema instruction without leading newlines
-        return schema_instruction.strip()
+        # If no user system prompt, just use the schema instruction on its own
+        parts = (_SCHEMA_INSTRUCTION_PREFIX, schema_json)
+    return "".join(parts)
 
 
 def should_disable_streaming(schema: Optional[Dict[str, Any]]) -> bool:
@@ -141,6 +330,9 @@ def should_disable_streaming(schema: Optional[Dict[str, Any]]) -> bool:
     automatically disabled for clean JSON parsing (unless user explicitly
     sets --stream or --no-stream).
 
+    Note that the check is identity-based, not truthiness-based: an
+    empty dict still counts as a schema and disables streaming.
+
     Args:
         schema: Schema dictionary if provided, None otherwise
 
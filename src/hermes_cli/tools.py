@@ -1,10 +1,76 @@
 """Tool registry and execution system for Hermes CLI."""
 
 import json
+import math
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, Callable, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the speed extra
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - exercised only without the speed extra
+    fastjsonschema = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+# executor's error handling works unchanged with either parser. Encoding
+# of outgoing content stays on json.dumps, which returns str not bytes.
+_loads = json.loads if orjson is None else orjson.loads
+
+# Exception tuple for the executor's except clause; empty when the
+# validator is unavailable so the clause simply never matches.
+_SCHEMA_VALIDATION_ERRORS = (
+    () if fastjsonschema is None else (fastjsonschema.JsonSchemaValueException,)
+)
+
+
+def _build_parser(parameters: Dict[str, Any]) -> Optional[Callable]:
+    """Generate a schema-specialized argument parser for a tool.
+
+    For the common case of an object schema where every property is
+    required, this emits straight-line code that loads the arguments JSON
+    and extracts the known keys in declaration order, so the executor can
+    call the tool positionally instead of through generic **kwargs
+    expansion. Schemas with optional properties (or none at all) return
+    None and keep the generic path.
+
+    Args:
+        parameters: JSON Schema for the tool's parameters
+
+    Returns:
+        Callable taking the raw arguments string and returning
+        (args_dict, positional_tuple), or None if the schema does not
+        fit the generated shape
+    """
+    if parameters.get("type") != "object":
+        return None
+    props = parameters.get("properties") or {}
+    required = parameters.get("required") or []
+    if not props or set(props) != set(required):
+        return None
+
+    extract = ", ".join(f"o[{key!r}]" for key in props)
+    # The length check makes unexpected keys raise KeyError alongside
+    # missing ones, so both fall back to the generic **kwargs call and
+    # surface the usual invalid-arguments message
+    source = (
+        "def _parse(s):\n"
+        "    o = _loads(s)\n"
+        f"    if len(o) != {len(props)}:\n"
+        "        raise KeyError('unexpected arguments')\n"
+        f"    return o, ({extract},)"
+    )
+    namespace = {"_loads": _loads}
+    exec(source, namespace)
+    return namespace["_parse"]
+
 
 def tool(name: str, description: str, parameters: Dict[str, Any], builtin: bool = False):
     """Decorator to register a function as a tool.
@@ -49,33 +115,117 @@ def tool(name: str, description: str, parameters: Dict[str, Any], builtin: bool
     return decorator
 
 
+def _discover_builtins() -> Dict[str, Callable]:
+    """Import the built-in tools and return them keyed by name."""
+    try:
+        from hermes_cli.builtin_tools import (
+            calculate,
+            execute_shell_command,
+            read_file,
+            write_file,
+            web_search
+        )
+    except ImportError as e:
+        print(f"Warning: Failed to load built-in tools: {e}", file=sys.stderr)
+        return {}
+
+    return {
+        tool_func.__tool_name__: tool_func
+        for tool_func in [calculate, execute_shell_command, read_file, write_file, web_search]
+    }
+
+
+class _ToolEntry:
+    """Fixed-slot record for one registered tool.
+
+    Bundles the function with everything derived from it at registration
+    — schema, source, compiled validator and generated parser — in a
+    compact __slots__ object instead of parallel dicts and per-call
+    attribute traversal.
+    """
+
+    __slots__ = ('name', 'func', 'schema', 'source', 'validator', 'parser')
+
+    def __init__(self, name, func, schema, source, validator, parser):
+        self.name = name
+        self.func = func
+        self.schema = schema
+        self.source = source
+        self.validator = validator
+        self.parser = parser
+
+
+def _make_entry(tool_func: Callable) -> _ToolEntry:
+    """Build the registry entry for a decorated tool function."""
+    schema = tool_func.__tool_schema__
+    parameters = schema["function"]["parameters"]
+    return _ToolEntry(
+        name=tool_func.__tool_name__,
+        func=tool_func,
+        schema=schema,
+        source="builtin" if getattr(tool_func, "__builtin__", False) else "user",
+        validator=None if fastjsonschema is None else fastjsonschema.compile(parameters),
+        parser=_build_parser(parameters),
+    )
+
+
+# Built-in tool table, assembled once at import time. Every ToolRegistry
+# (and there is one per CLI invocation plus one per registry-constructing
+# test) copies it instead of re-importing and re-compiling. The proxy
+# keeps the shared table immutable; registries mutate only their own
+# copies.
+_BUILTIN_ENTRIES = MappingProxyType({
+    name: _make_entry(func) for name, func in _discover_builtins().items()
+})
+
+
 class ToolRegistry:
     """Manages the tool library and selection."""
 
     def __init__(self):
-        """Initialize tool registry and load all available tools."""
-        self.tools: Dict[str, Callable] = {}
-        self._load_builtin_tools()
+        """Initialize tool registry with the built-in tools.
 
-    def _load_builtin_tools(self):
-        """Load built-in tools from builtin_tools/ directory."""
-        try:
-            from hermes_cli.builtin_tools import (
-                calculate,
-                execute_shell_command,
-                read_file,
-                write_file,
-                web_search
-            )
+        The built-in entries (with their compiled validators and
+        parsers) are assembled once at module import; each registry
+        starts from a plain-dict copy, so construction does no imports,
+        schema compiles or codegen.
+        """
+        self.tools: Dict[str, _ToolEntry] = dict(_BUILTIN_ENTRIES)
+        # Known names as a frozenset for set-difference validation, and a
+        # per-instance memo of resolved specs (the CLI passes the same
+        # --use-tools string on every turn of a tool loop).
+        self._names_frozen = frozenset(self.tools)
+        self._select_cached = lru_cache(maxsize=64)(self._select_tools_uncached)
+        # Schemas are immutable after registration, so the name->schema
+        # table and the full list are built once instead of walking
+        # entries on every get_tool_schemas call.
+        self._schema_by_name = {
+            name: entry.schema for name, entry in self.tools.items()
+        }
+        self._all_schemas = list(self._schema_by_name.values())
+
+    def _register(self, tool_func: Callable):
+        """Register a tool function, building its registry entry.
 
-            for tool_func in [calculate, execute_shell_command, read_file, write_file, web_search]:
-                self.tools[tool_func.__tool_name__] = tool_func
-        except ImportError as e:
-            print(f"Warning: Failed to load built-in tools: {e}", file=sys.stderr)
+        Args:
+            tool_func: Function decorated with @tool
+        """
+        entry = _make_entry(tool_func)
+        self.tools[entry.name] = entry
+        # The name set, schema tables and any cached selections are
+        # stale once a new tool appears.
+        self._names_frozen = frozenset(self.tools)
+        self._select_cached.cache_clear()
+        self._schema_by_name[entry.name] = entry.schema
+        self._all_schemas = list(self._schema_by_name.values())
 
     def select_tools(self, tool_spec: str) -> Dict[str, Callable]:
         """Select tools based on specification.
 
+        Results are memoized per spec string, so repeat calls with the
+        same --use-tools value (every turn of a tool loop) return the
+        same dict without re-parsing; callers must not mutate it.
+
         Args:
             tool_spec: Comma-separated tool names, or 'all' for all available
 
@@ -85,34 +235,43 @@ class ToolRegistry:
         Raises:
             ValueError: If any specified tool is not found
         """
-        selected = {}
+        return self._select_cached(tool_spec)
 
+    def _select_tools_uncached(self, tool_spec: str) -> Dict[str, Callable]:
+        """Resolve a tool spec; backing implementation for select_tools."""
         if tool_spec == "all":
-            selected.update(self.tools)
-        else:
-            tool_names = [name.strip() for name in tool_spec.split(",")]
-            for name in tool_names:
-                if name not in self.tools:
-                    available = ", ".join(sorted(self.tools.keys()))
-                    raise ValueError(
-                        f"Unknown tool: '{name}'\n"
-                        f"Available tools: {available}\n"
-                        f"Use 'hermes tools list' to see all tools"
-                    )
-                selected[name] = self.tools[name]
-
-        return selected
+            return {name: entry.func for name, entry in self.tools.items()}
+
+        tool_names = [name.strip() for name in tool_spec.split(",")]
+        unknown = frozenset(tool_names) - self._names_frozen
+        if unknown:
+            # Report the first unknown name in spec order, matching the
+            # old per-name loop.
+            name = next(n for n in tool_names if n in unknown)
+            available = ", ".join(sorted(self._names_frozen))
+            raise ValueError(
+                f"Unknown tool: '{name}'\n"
+                f"Available tools: {available}\n"
+                f"Use 'hermes tools list' to see all tools"
+            )
+        return {name: self.tools[name].func for name in tool_names}
 
     def get_tool_schemas(self, selected_tools: Dict[str, Callable]) -> list[dict]:
         """Get OpenAI-compatible schemas for selected tools.
 
+        The common 'all' selection returns the precomputed full list
+        without copying; callers must not mutate the result. Partial
+        selections are k dict lookups in the name->schema table.
+
         Args:
             selected_tools: Dict of selected tool functions
 
         Returns:
             List of tool schemas for API request
         """
-        return [tool.__tool_schema__ for tool in selected_tools.values()]
+        if len(selected_tools) == len(self._schema_by_name):
+            return self._all_schemas
+        return [self._schema_by_name[name] for name in selected_tools]
 
     def list_tools(self) -> dict:
         """List all available tools categorized by source.
@@ -122,10 +281,8 @@ class ToolRegistry:
         """
         result = {"builtin": {}, "user": {}}
 
-        for name, tool_func in sorted(self.tools.items()):
-            desc = tool_func.__tool_schema__["function"]["description"]
-            source = "builtin" if getattr(tool_func, "__builtin__", False) else "user"
-            result[source][name] = desc
+        for name, entry in sorted(self.tools.items()):
+            result[entry.source][name] = entry.schema["function"]["description"]
 
         return result
 
@@ -141,20 +298,50 @@ class ToolRegistry:
         Raises:
             ValueError: If tool not found
         """
-        if tool_name not in self.tools:
+        entry = self.tools.get(tool_name)
+        if entry is None:
             raise ValueError(f"Tool not found: {tool_name}")
 
-        tool_func = self.tools[tool_name]
-        schema = tool_func.__tool_schema__["function"]
-
+        function_schema = entry.schema["function"]
         return {
-            "name": tool_name,
-            "description": schema["description"],
-            "parameters": schema["parameters"],
-            "source": "builtin" if getattr(tool_func, "__builtin__", False) else "user"
+            "name": entry.name,
+            "description": function_schema["description"],
+            "parameters": function_schema["parameters"],
+            "source": entry.source
         }
 
 
+def _format_result(result: Any) -> str:
+    """Serialize a tool result for the message content field.
+
+    Scalar single-key {"result": <number>} results — the shape every
+    calculate call produces — are built by string concatenation, since
+    the reprs of ints, bools and finite floats are valid JSON already.
+    Anything else goes through json.dumps; the output stays loadable
+    with json.loads either way.
+
+    Args:
+        result: Value returned by the tool function
+
+    Returns:
+        JSON string (or the result itself if the tool returned a string)
+    """
+    if isinstance(result, str):
+        return result
+
+    if type(result) is dict and len(result) == 1:
+        value = result.get("result")
+        value_type = type(value)
+        if value_type is bool:
+            return '{"result": true}' if value else '{"result": false}'
+        if value_type is int:
+            return f'{{"result": {value}}}'
+        if value_type is float and math.isfinite(value):
+            return f'{{"result": {value!r}}}'
+
+    return json.dumps(result)
+
+
 class ToolExecutor:
     """Handles tool execution and result formatting."""
 
@@ -195,22 +382,50 @@ class ToolExecutor:
         args_json = tool_call["function"]["arguments"]
 
         try:
-            # Parse arguments
-            args = json.loads(args_json)
+            entry = self.registry.tools.get(func_name)
+
+            # Parse arguments, preferring the schema-specialized parser
+            # generated at registration; it extracts the known keys in
+            # one pass so the tool can be called positionally. A missing
+            # or unexpected key falls back to the generic path so the
+            # usual argument-error messages surface.
+            positional = None
+            parser = entry.parser if entry is not None else None
+            if parser is not None:
+                try:
+                    args, positional = parser(args_json)
+                except KeyError:
+                    args = _loads(args_json)
+            else:
+                args = _loads(args_json)
 
             # Verify tool is in selected tools
             if func_name not in selected_tools:
                 raise ValueError(f"Tool '{func_name}' not in enabled tools")
 
+            # Validate arguments with the compiled schema checker, if one
+            # was built at registration time
+            if entry is not None and entry.validator is not None:
+                entry.validator(args)
+
             # Execute tool
             tool_func = selected_tools[func_name]
-            result = tool_func(**args)
-
-            # Format successful result
-            content = json.dumps(result) if not isinstance(result, str) else result
+            if positional is not None:
+                result = tool_func(*positional)
+            else:
+                result = tool_func(**args)
+
+            # Format successful result. The dominant calculate shape
+            # {"result": <number>} is serialized by concatenation —
+            # Python's int and finite-float reprs are already valid JSON
+            # — skipping the generic encoder; everything else (strings,
+            # containers, non-finite floats) takes json.dumps as before.
+            content = _format_result(result)
 
         except json.JSONDecodeError as e:
             content = json.dumps({"error": f"Invalid arguments JSON: {str(e)}"})
+        except _SCHEMA_VALIDATION_ERRORS as e:
+            content = json.dumps({"error": f"Invalid arguments for tool: {str(e)}"})
         except TypeError as e:
             content = json.dumps({"error": f"Invalid arguments for tool: {str(e)}"})
         except Exception as e:
@@ -226,6 +441,12 @@ class ToolExecutor:
     def execute_tool_calls(self, tool_calls: list[dict], selected_tools: Dict[str, Callable]) -> list[dict]:
         """Execute multiple tool calls.
 
+        When the model requests more than one call, the independent
+        calls run concurrently on a small thread pool: the built-in
+        tools are mostly I/O-bound (files, shell, web search), so wall
+        time drops from the sum of the latencies to roughly the slowest
+        call. Results are returned in the order the calls were given.
+
         Args:
             tool_calls: List of tool call dicts
             selected_tools: Dict of currently enabled tools
@@ -233,4 +454,12 @@ class ToolExecutor:
         Returns:
             List of tool message dicts
         """
-        return [self.execute_tool_call(tc, selected_tools) for tc in tool_calls]
+        if len(tool_calls) <= 1:
+            return [self.execute_tool_call(tc, selected_tools) for tc in tool_calls]
+
+        with ThreadPoolExecutor(max_workers=min(8, len(tool_calls))) as pool:
+            futures = [
+                pool.submit(self.execute_tool_call, tc, selected_tools)
+                for tc in tool_calls
+            ]
+            return [future.result() for future in futures]
@@ -1,21 +1,92 @@
 """Helper functions for Hermes CLI."""
 
+import os
+import shutil
 import sys
-from typing import Optional
+from functools import lru_cache
+from io import StringIO
+from typing import Dict, Optional, Tuple
 from rich.console import Console
 from rich.panel import Panel
 from rich.style import Style
 
+_NO_PROMPT_MSG = (
+    "No prompt provided. Please provide a prompt as an argument or pipe input.\n"
+    "Examples:\n"
+    "  hermes \"Your prompt here\"\n"
+    "  echo \"Your prompt\" | hermes"
+)
+
+# One Console for all bordered output, writing into a reusable capture
+# buffer. Console construction (terminal detection, color probing, theme
+# load) is far more expensive than a render, so it happens once at
+# import; the terminal width is sampled at the same time. The capture
+# buffer is not a terminal, so the console is told to style (or not)
+# according to the real stdout — interactive runs keep their ANSI
+# colors, piped output stays plain, matching a per-call Console().
+_BORDER_STYLE = Style(color="cyan", bold=True)
+_CAPTURE = StringIO()
+_CONSOLE = Console(
+    file=_CAPTURE,
+    force_terminal=sys.__stdout__ is not None and sys.__stdout__.isatty(),
+    width=shutil.get_terminal_size().columns,
+)
+
+
+@lru_cache(maxsize=1)
+def _stdin_is_tty() -> bool:
+    """Return whether stdin is attached to a terminal, cached.
+
+    isatty() is a syscall and its answer cannot change for the life of
+    the process, so it is asked at most once; repeat read_stdin calls
+    skip it entirely. Tests that swap sys.stdin call cache_clear().
+
+    When stdin has a real descriptor the probe goes through os.isatty,
+    which dispatches straight to the C call instead of walking the text
+    wrapper / buffered reader / raw file method chain; stand-ins without
+    a descriptor answer through their own isatty().
+    """
+    try:
+        fd = sys.stdin.fileno()
+    except (OSError, ValueError):
+        return sys.stdin.isatty()
+    return os.isatty(fd)
+
 
 def read_stdin() -> Optional[str]:
     """Read input from stdin if available.
 
+    Piped input is read as raw bytes, stripped at the byte level and
+    decoded in one pass, instead of going through the text wrapper's
+    incremental decoder and then re-allocating a stripped copy.
+    (bytes.strip trims ASCII whitespace, which is what shells and pipes
+    produce at the edges.) When stdin has a real file descriptor the
+    bytes come straight from os.read in 64 KiB chunks, skipping the
+    BufferedReader's intermediate copy for large payloads; file-like
+    stand-ins without a descriptor fall back to the buffered read.
+
     Returns:
         Content from stdin if piped, None otherwise
     """
-    if not sys.stdin.isatty():
-        return sys.stdin.read().strip()
-    return None
+    if _stdin_is_tty():
+        return None
+    try:
+        fd = sys.stdin.fileno()
+    except (OSError, ValueError):
+        fd = None
+    if fd is None:
+        raw = sys.stdin.buffer.read()
+    else:
+        # Nothing has touched stdin yet, so the buffer holds no
+        # read-ahead bytes and the raw descriptor sees the whole pipe
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        raw = chunks[0] if len(chunks) == 1 else b''.join(chunks)
+    return raw.strip().decode('utf-8', errors='replace')
 
 
 def get_user_prompt(cli_prompt: Optional[str]) -> str:
@@ -30,6 +101,11 @@ def get_user_prompt(cli_prompt: Optional[str]) -> str:
     Raises:
         ValueError: If no prompt is provided via CLI or stdin
     """
+    # Fast path: with a CLI prompt and an interactive stdin there is
+    # nothing piped to prefer, so return without touching the read path
+    if cli_prompt and _stdin_is_tty():
+        return cli_prompt
+
     # Check for piped input first (takes priority)
     stdin_input = read_stdin()
     if stdin_input:
@@ -40,12 +116,15 @@ def get_user_prompt(cli_prompt: Optional[str]) -> str:
         return cli_prompt
 
     # No input provided
-    raise ValueError(
-        "No prompt provided. Please provide a prompt as an argument or pipe input.\n"
-        "Examples:\n"
-        "  hermes \"Your prompt here\"\n"
-        "  echo \"Your prompt\" | hermes"
-    )
+    raise ValueError(_NO_PROMPT_MSG)
+
+
+# Finished renders keyed by (content, model). Replays of the same text
+# (retries, conversation replays) skip the rich pipeline entirely; the
+# dict is wiped rather than evicted per-entry once it fills up, which
+# keeps the hot path to a single get.
+_FMT_CACHE: Dict[Tuple[str, str], str] = {}
+_FMT_CACHE_MAX = 128
 
 
 def format_with_border(content: str, model: str) -> str:
@@ -57,20 +136,40 @@ def format_with_border(content: str, model: str) -> str:
     Returns:
         The content formatted with a handsome ASCII border
     """
-    console = Console()
-
+    key = (content, model)
+    cached = _FMT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    result = _render_border(content, model)
+    if len(_FMT_CACHE) >= _FMT_CACHE_MAX:
+        _FMT_CACHE.clear()
+    _FMT_CACHE[key] = result
+    return result
+
+
+def _render_border(content: str, model: str) -> str:
+    """Render the bordered panel through rich (uncached)."""
     # Create a beautiful panel with rounded corners and a gradient-style border
     panel = Panel(
         content,
-        border_style=Style(color="cyan", bold=True),
+        border_style=_BORDER_STYLE,
         padding=(1, 2),
         expand=False,
         title=f"[bold magenta]✨ {model} ✨[/bold magenta]",
         title_align="center",
     )
 
-    # Capture the output to a string
-    with console.capture() as capture:
-        console.print(panel)
-
-    return capture.get().rstrip()
+    # Render through the shared console, rewinding its capture buffer
+    # instead of building a fresh Console + StringIO per call
+    _CAPTURE.seek(0)
+    _CAPTURE.truncate()
+    _CONSOLE.print(panel)
+
+    # The render ends at the panel's bottom edge plus Console.print's
+    # newline(s); trim just those instead of an rstrip pass that checks
+    # every trailing character against the whitespace table
+    s = _CAPTURE.getvalue()
+    end = len(s)
+    while end > 0 and s[end - 1] == '\n':
+        end -= 1
+    return s[:end] if end != len(s) else s
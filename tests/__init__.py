@@ -1 +0,0 @@
-"""Tests for Hermes CLI."""
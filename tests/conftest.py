@@ -0,0 +1,143 @@
+"""Shared fixtures for the test suite."""
+
+from types import SimpleNamespace
+
+import pytest
+
+import hermes_cli.main
+import hermes_cli.utils
+from hermes_cli.tools import ToolRegistry
+
+
+@pytest.fixture(autouse=True)
+def reset_stdin_cache():
+    """Start every test with utils' stdin TTY cache cold.
+
+    Tests swap sys.stdin and patch isatty freely; clearing the
+    per-process memo makes each test's own patch the one that gets
+    cached.
+    """
+    hermes_cli.utils._stdin_is_tty.cache_clear()
+
+
+class FakePath:
+    """Stand-in for pathlib.Path in the file-tool tests.
+
+    One monkeypatched name replaces a stack of pathlib.Path.* patches:
+    it poses as an existing 100-byte file with fixed contents, and
+    records the last write_text call on the class for assertions.
+    """
+
+    written = None  # (content, encoding) of the last write_text
+
+    def __init__(self, p):
+        self._p = p
+
+    def expanduser(self):
+        return self
+
+    def exists(self):
+        return True
+
+    def is_file(self):
+        return True
+
+    def stat(self):
+        return SimpleNamespace(st_size=100)
+
+    def read_text(self, encoding=None):
+        return "file content"
+
+    @property
+    def parent(self):
+        return self
+
+    def mkdir(self, parents=False, exist_ok=False):
+        return None
+
+    def write_text(self, content, encoding=None):
+        type(self).written = (content, encoding)
+
+
+@pytest.fixture
+def fake_path(monkeypatch):
+    """Install FakePath as the file built-in's Path; returns the class."""
+    FakePath.written = None
+    monkeypatch.setattr("hermes_cli.builtin_tools.file.Path", FakePath)
+    return FakePath
+
+
+@pytest.fixture(scope="session")
+def shared_registry():
+    """One ToolRegistry for the whole session.
+
+    The registry tests only read from it; any test that registers its
+    own tools should build a fresh ToolRegistry() instead.
+    """
+    return ToolRegistry()
+
+
+# Canned chat_completion responses shared across the tool-loop tests.
+CANNED_TOOL_CALL_RESPONSE = {
+    "choices": [{
+        "finish_reason": "tool_calls",
+        "message": {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{
+                "id": "call_123",
+                "type": "function",
+                "function": {
+                    "name": "calculate",
+                    "arguments": '{"expression": "2 + 2"}'
+                }
+            }]
+        }
+    }]
+}
+CANNED_FINAL_RESPONSE = {
+    "choices": [{
+        "finish_reason": "stop",
+        "message": {
+            "role": "assistant",
+            "content": "The answer is 4."
+        }
+    }]
+}
+
+
+class FakeNousClient:
+    """Minimal stand-in for NousAPIClient.
+
+    Plays back the queued responses in order, then repeats the final
+    canned answer. Plain attribute access keeps it far cheaper than a
+    MagicMock inside the tool loop, where chat_completion is hit once
+    per iteration.
+    """
+
+    TOOL_CALL_RESPONSE = CANNED_TOOL_CALL_RESPONSE
+    FINAL_RESPONSE = CANNED_FINAL_RESPONSE
+
+    # Per-test playback queue; reset by the fake_nous_client fixture.
+    responses = (CANNED_FINAL_RESPONSE,)
+
+    def __init__(self, *args, **kwargs):
+        self._pending = iter(self.responses)
+
+    def chat_completion(self, **kwargs):
+        try:
+            return next(self._pending)
+        except StopIteration:
+            return CANNED_FINAL_RESPONSE
+
+
+@pytest.fixture
+def fake_nous_client(monkeypatch):
+    """Install FakeNousClient as the client main.py constructs.
+
+    Yields the class; tests queue responses by assigning
+    FakeNousClient.responses before invoking the CLI.
+    """
+    monkeypatch.setattr(hermes_cli.main, "NousAPIClient", FakeNousClient)
+    yield FakeNousClient
+    FakeNousClient.responses = (CANNED_FINAL_RESPONSE,)
@@ -11,13 +11,13 @@ from hermes_cli.chat import ConversationManager
 class TestConversationManagerInitialization:
     """Tests for ConversationManager initialization."""
 
-    def test_init_with_default_directory(self, tmp_path):
+    def test_init_with_default_directory(self, tmp_path, monkeypatch):
         """Test initialization with default conversations directory."""
-        with patch('pathlib.Path.home', return_value=tmp_path):
-            manager = ConversationManager()
-            expected_dir = tmp_path / ".hermes" / "conversations"
-            assert manager.conversations_dir == expected_dir
-            assert expected_dir.exists()
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        manager = ConversationManager()
+        expected_dir = tmp_path / ".hermes" / "conversations"
+        assert manager.conversations_dir == expected_dir
+        assert expected_dir.exists()
 
     def test_init_with_custom_directory(self, tmp_path):
         """Test initialization with custom conversations directory."""
@@ -303,6 +303,45 @@ class TestSaveConversation:
         assert updated_data["updated_at"] > original_updated
 
 
+class TestSaveMany:
+    """Tests for save_many method."""
+
+    def test_save_many_writes_all_conversations(self, tmp_path):
+        """Test that save_many persists every conversation in the batch."""
+        manager = ConversationManager(conversations_dir=tmp_path)
+
+        msg = {"role": "user", "content": "Hi"}
+        name1, _ = manager.create_conversation("batch-one", msg)
+        name2, _ = manager.create_conversation("batch-two", msg)
+
+        data1 = manager.load_conversation(name1)
+        data2 = manager.load_conversation(name2)
+        data1["messages"].append({"role": "assistant", "content": "One"})
+        data2["messages"].append({"role": "assistant", "content": "Two"})
+
+        manager.save_many([(name1, data1), (name2, data2)])
+
+        assert manager.load_conversation(name1)["messages"][1]["content"] == "One"
+        assert manager.load_conversation(name2)["messages"][1]["content"] == "Two"
+
+    def test_save_many_uses_shared_timestamp(self, tmp_path):
+        """Test that all conversations in a batch get the same updated_at."""
+        manager = ConversationManager(conversations_dir=tmp_path)
+
+        msg = {"role": "user", "content": "Hi"}
+        name1, _ = manager.create_conversation("stamp-one", msg)
+        name2, _ = manager.create_conversation("stamp-two", msg)
+
+        manager.save_many([
+            (name1, manager.load_conversation(name1)),
+            (name2, manager.load_conversation(name2)),
+        ])
+
+        updated1 = manager.load_conversation(name1)["updated_at"]
+        updated2 = manager.load_conversation(name2)["updated_at"]
+        assert updated1 == updated2
+
+
 class TestAddMessage:
     """Tests for add_message method."""
 
@@ -389,6 +428,19 @@ class TestGetMessages:
         assert messages[2]["role"] == "assistant"
         assert messages[3]["role"] == "user"
 
+    def test_iter_messages_yields_in_order(self, tmp_path):
+        """Test that iter_messages yields messages in conversation order."""
+        manager = ConversationManager(conversations_dir=tmp_path)
+
+        initial_msg = {"role": "user", "content": "Hello"}
+        name, _ = manager.create_conversation("itertest", initial_msg)
+        manager.add_message(name, "assistant", "Hi!")
+
+        messages = list(manager.iter_messages(name))
+        assert len(messages) == 2
+        assert messages[0]["content"] == "Hello"
+        assert messages[1]["content"] == "Hi!"
+
     def test_get_messages_returns_list(self, tmp_path):
         """Test that get_messages returns a list."""
         manager = ConversationManager(conversations_dir=tmp_path)
@@ -481,6 +533,37 @@ class TestListConversations:
         assert conv["model"] == "Hermes-4-70B"
         assert conv["message_count"] == 2  # system + user
 
+    def test_list_conversations_from_fresh_manager_instance(self, tmp_path):
+        """Test that a new manager instance sees previously created conversations."""
+        msg = {"role": "user", "content": "Hello"}
+        first_manager = ConversationManager(conversations_dir=tmp_path)
+        first_manager.create_conversation("persisted", msg, model="Hermes-4-70B")
+
+        # A fresh instance (e.g. a new CLI invocation) seeds its metadata
+        # cache from the persistent index
+        second_manager = ConversationManager(conversations_dir=tmp_path)
+        conversations = second_manager.list_conversations()
+
+        assert len(conversations) == 1
+        assert conversations[0]["name"] == "persisted"
+        assert conversations[0]["model"] == "Hermes-4-70B"
+
+    def test_list_conversations_index_ignores_externally_modified_files(self, tmp_path):
+        """Test that indexed metadata is revalidated against file mtimes."""
+        msg = {"role": "user", "content": "Hello"}
+        manager = ConversationManager(conversations_dir=tmp_path)
+        name, path = manager.create_conversation("external", msg)
+
+        # Rewrite the file behind the manager's back with a different mtime
+        import os
+        data = manager.load_conversation(name)
+        data["model"] = "Hermes-4-70B"
+        path.write_text(json.dumps(data))
+        os.utime(path, ns=(0, 0))
+
+        conversations = ConversationManager(conversations_dir=tmp_path).list_conversations()
+        assert conversations[0]["model"] == "Hermes-4-70B"
+
     def test_list_conversations_skips_malformed_files(self, tmp_path):
         """Test that malformed JSON files are skipped."""
         manager = ConversationManager(conversations_dir=tmp_path)
@@ -624,6 +707,47 @@ class TestDeleteConversation:
         assert manager.get_active_session() == name1
 
 
+class TestDeleteMany:
+    """Tests for delete_many method."""
+
+    def test_delete_many_removes_all_files(self, tmp_path):
+        """Test that delete_many removes every named conversation."""
+        manager = ConversationManager(conversations_dir=tmp_path)
+
+        msg = {"role": "user", "content": "Test"}
+        name1, path1 = manager.create_conversation("bulk-one", msg)
+        name2, path2 = manager.create_conversation("bulk-two", msg)
+
+        manager.delete_many([name1, name2])
+
+        assert not path1.exists()
+        assert not path2.exists()
+
+    def test_delete_many_missing_name_deletes_nothing(self, tmp_path):
+        """Test that a missing name aborts the batch before any deletion."""
+        manager = ConversationManager(conversations_dir=tmp_path)
+
+        msg = {"role": "user", "content": "Test"}
+        name, path = manager.create_conversation("survivor", msg)
+
+        with pytest.raises(FileNotFoundError):
+            manager.delete_many([name, "nonexistent"])
+
+        assert path.exists()
+
+    def test_delete_many_clears_active_session(self, tmp_path):
+        """Test that deleting the active conversation clears the session."""
+        manager = ConversationManager(conversations_dir=tmp_path)
+
+        msg = {"role": "user", "content": "Test"}
+        name, _ = manager.create_conversation("bulk-active", msg)
+        manager.set_active_session(name)
+
+        manager.delete_many([name])
+
+        assert manager.get_active_session() is None
+
+
 class TestEdgeCases:
     """Tests for edge cases and error conditions."""
 
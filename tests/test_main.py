@@ -1,561 +1,385 @@
 """Tests for CLI main module."""
 
-import json
+import contextlib
+import io
+import sys
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 from click.testing import CliRunner
+import hermes_cli.main
 from hermes_cli.main import cli
 from hermes_cli.api import APIError
 
 
-class TestCLIBasicFunctionality:
-    """Tests for basic CLI functionality."""
+def _response(content):
+    """Build a chat_completion response payload around the given content."""
+    return {"choices": [{"message": {"content": content}}]}
+
+
+# Shared response payloads. Tests only read these through the mocked
+# client, so one instance of each can serve the whole module.
+_RESP = _response("Response")
+_RESP_TEST = _response("Test response")
+_RESP_COMPLETE = _response("Complete response")
+
+# Frequently reused CLI invocations as immutable module-level tuples;
+# CliRunner.invoke accepts any sequence, so one tuple serves all tests.
+ARGS_NO_STREAM = ('--no-stream', 'Test')
+ARGS_NO_STREAM_PROMPT = ('--no-stream', 'Test prompt')
+
+# Streaming chunk sequences; tests wrap them in iter() per use since the
+# mocked chat_completion must return a fresh iterator each time.
+_STREAM_HELLO_WORLD = ("Hello", " ", "world")
+_STREAM_HELLO = ("Hello", " world")
+
+# Schema inputs shared by the schema and border tests.
+_SCHEMA_ANSWER = '{"type": "object", "properties": {"answer": {"type": "string"}}}'
+_SCHEMA_MIN = '{"type": "object"}'
+
+
+def _invoke_fast(args):
+    """Run the CLI through Click directly, without CliRunner.
+
+    For tests that only assert on what reached the (fake) client,
+    CliRunner's stream isolation, exception capture and Result
+    construction are pure overhead. This builds the context and invokes
+    the group in-process, discarding stdout. Errors surface as the
+    exceptions the CLI actually raises (UsageError, SystemExit), which
+    kwarg-only tests never hit.
+    """
+    old_stdin = sys.stdin
+    # Empty non-tty stdin with a byte buffer underneath, as CliRunner
+    # provides (read_stdin reads sys.stdin.buffer).
+    sys.stdin = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    try:
+        with io.StringIO() as buf, contextlib.redirect_stdout(buf):
+            ctx = cli.make_context("cli", list(args))
+            with ctx:
+                cli.invoke(ctx)
+    finally:
+        sys.stdin = old_stdin
+
+
+class _FakeClient:
+    """Minimal kwargs-capturing stand-in for kwarg-only tests.
+
+    Tests that only inspect what the CLI forwarded to chat_completion
+    don't need Mock's attribute machinery; a plain class with one
+    recording method is cheaper and reads as exactly what it is.
+    """
+    __slots__ = ("resp", "last_kwargs")
+
+    def __init__(self, resp=_RESP):
+        self.resp = resp
+        self.last_kwargs = None
+
+    def chat_completion(self, **kwargs):
+        self.last_kwargs = kwargs
+        return self.resp
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_api_client():
+    """Patch NousAPIClient once for the whole module.
+
+    Entering mock.patch per test is far slower than a single attribute
+    swap; every test shares one factory/client pair and the per-test
+    _reset_client fixture restores their state. Because the Mocks are
+    built once per module, output-only tests don't pay per-test Mock
+    construction either, so a separate SimpleNamespace-based stub for
+    them would just add a second mechanism without removing any work.
+    """
+    client = Mock()
+    factory = Mock(return_value=client)
+    original = hermes_cli.main.NousAPIClient
+    hermes_cli.main.NousAPIClient = factory
+    yield factory, client
+    hermes_cli.main.NousAPIClient = original
+
+
+@pytest.fixture(autouse=True)
+def _reset_client(_patch_api_client):
+    """Reset the shared client mocks before each test."""
+    factory, client = _patch_api_client
+    factory.reset_mock(return_value=True, side_effect=True)
+    factory.side_effect = None
+    factory.return_value = client
+    client.reset_mock(return_value=True, side_effect=True)
+    client.chat_completion.side_effect = None
+    # Pre-arm the common case so most tests need no per-test setup;
+    # tests that need a different payload simply override it.
+    client.chat_completion.return_value = _RESP
+
+
+@pytest.fixture
+def mock_client_class(_patch_api_client):
+    """The patched NousAPIClient factory (for constructor-level errors)."""
+    return _patch_api_client[0]
+
+
+@pytest.fixture
+def mock_client(_patch_api_client):
+    """The shared client instance returned by the patched factory."""
+    return _patch_api_client[1]
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    """Install a _FakeClient in place of the module-wide mock factory."""
+    fake = _FakeClient()
+    monkeypatch.setattr(hermes_cli.main, "NousAPIClient", lambda *a, **kw: fake)
+    return fake
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Create a single CLI test runner shared by the whole module.
+
+    CliRunner.invoke keeps no state on the runner between calls, so one
+    instance can serve every test instead of being rebuilt per test.
+    """
+    return CliRunner()
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI test runner."""
-        return CliRunner()
 
+class TestCLIBasicFunctionality:
+    """Tests for basic CLI functionality."""
     def test_cli_requires_prompt(self, runner):
-        """Test that CLI requires a prompt from either argument or stdin."""
-        with patch('hermes_cli.main.NousAPIClient'):
-            with patch('sys.stdin.isatty', return_value=True):
-                result = runner.invoke(cli, [])
-                assert result.exit_code != 0
+        """Test that CLI requires a prompt from either argument or stdin.
 
-    def test_cli_with_positional_prompt(self, runner):
-        """Test CLI with positional prompt argument."""
-        mock_response = {
-            "choices": [{"message": {"content": "Test response"}}]
-        }
+        No isatty patching is needed: CliRunner.invoke installs an
+        isolated, empty stdin, so read_stdin finds no piped input and the
+        CLI falls through to the missing-prompt error.
+        """
+        result = runner.invoke(cli, [])
+        assert result.exit_code != 0
 
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
+    def test_cli_with_positional_prompt(self, runner, mock_client):
+        """Test CLI with positional prompt argument."""
+        mock_client.chat_completion.return_value = _RESP_TEST
 
-            result = runner.invoke(cli, ['--no-stream', 'Test prompt'])
+        result = runner.invoke(cli, ARGS_NO_STREAM_PROMPT)
 
-            assert result.exit_code == 0
-            assert "Test response" in result.output
-            mock_client.chat_completion.assert_called_once()
+        assert result.exit_code == 0
+        assert b"Test response" in result.output_bytes
+        mock_client.chat_completion.assert_called_once()
 
-    def test_cli_with_system_prompt(self, runner):
+    def test_cli_with_system_prompt(self, runner, mock_client):
         """Test CLI with system prompt option."""
-        mock_response = {
-            "choices": [{"message": {"content": "Response"}}]
-        }
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
+        result = runner.invoke(cli, (
+            '--no-stream',
+            '-s', 'You are helpful',
+            'Hello'
+        ))
 
-            result = runner.invoke(cli, [
-                '--no-stream',
-                '-s', 'You are helpful',
-                'Hello'
-            ])
-
-            assert result.exit_code == 0
-            call_args = mock_client.chat_completion.call_args[1]
-            messages = call_args['messages']
-            assert len(messages) == 2
-            assert messages[0]['role'] == 'system'
-            assert messages[0]['content'] == 'You are helpful'
+        assert result.exit_code == 0
+        call_args = mock_client.chat_completion.call_args[1]
+        messages = call_args['messages']
+        assert len(messages) == 2
+        assert messages[0]['role'] == 'system'
+        assert messages[0]['content'] == 'You are helpful'
 
 
 class TestCLITemperatureAndMaxTokens:
     """Tests for temperature and max_tokens parameters."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI test runner."""
-        return CliRunner()
-
-    def test_cli_default_temperature(self, runner):
-        """Test that default temperature is 0.7."""
-        mock_response = {
-            "choices": [{"message": {"content": "Response"}}]
-        }
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, ['--no-stream', 'Test'])
-
-            assert result.exit_code == 0
-            call_args = mock_client.chat_completion.call_args[1]
-            assert call_args['temperature'] == 0.7
-
-    def test_cli_default_max_tokens(self, runner):
-        """Test that default max_tokens is 2048."""
-        mock_response = {
-            "choices": [{"message": {"content": "Response"}}]
-        }
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, ['--no-stream', 'Test'])
-
-            assert result.exit_code == 0
-            call_args = mock_client.chat_completion.call_args[1]
-            assert call_args['max_tokens'] == 2048
-
-    def test_cli_custom_temperature(self, runner):
-        """Test CLI with custom temperature."""
-        mock_response = {
-            "choices": [{"message": {"content": "Response"}}]
-        }
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, [
-                '--no-stream',
-                '-t', '0.5',
-                'Test prompt'
-            ])
-
-            assert result.exit_code == 0
-            call_args = mock_client.chat_completion.call_args[1]
-            assert call_args['temperature'] == 0.5
-
-    def test_cli_custom_temperature_long_flag(self, runner):
-        """Test CLI with custom temperature using long flag."""
-        mock_response = {
-            "choices": [{"message": {"content": "Response"}}]
-        }
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, [
-                '--no-stream',
-                '--temperature', '1.2',
-                'Test prompt'
-            ])
-
-            assert result.exit_code == 0
-            call_args = mock_client.chat_completion.call_args[1]
-            assert call_args['temperature'] == 1.2
-
-    def test_cli_custom_max_tokens(self, runner):
-        """Test CLI with custom max_tokens."""
-        mock_response = {
-            "choices": [{"message": {"content": "Response"}}]
-        }
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, [
-                '--no-stream',
-                '-mt', '1024',
-                'Test prompt'
-            ])
-
-            assert result.exit_code == 0
-            call_args = mock_client.chat_completion.call_args[1]
-            assert call_args['max_tokens'] == 1024
-
-    def test_cli_custom_max_tokens_long_flag(self, runner):
-        """Test CLI with custom max_tokens using long flag."""
-        mock_response = {
-            "choices": [{"message": {"content": "Response"}}]
-        }
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, [
-                '--no-stream',
-                '--max-tokens', '512',
-                'Test prompt'
-            ])
-
-            assert result.exit_code == 0
-            call_args = mock_client.chat_completion.call_args[1]
-            assert call_args['max_tokens'] == 512
-
-    def test_cli_both_temperature_and_max_tokens(self, runner):
-        """Test CLI with both temperature and max_tokens."""
-        mock_response = {
-            "choices": [{"message": {"content": "Response"}}]
-        }
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, [
-                '--no-stream',
-                '-t', '0.3',
-                '-mt', '256',
-                'Test prompt'
-            ])
-
-            assert result.exit_code == 0
-            call_args = mock_client.chat_completion.call_args[1]
-            assert call_args['temperature'] == 0.3
-            assert call_args['max_tokens'] == 256
-
-    def test_cli_temperature_with_streaming(self, runner):
-        """Test temperature parameter works with streaming."""
-        mock_chunks = ["Hello", " world"]
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = iter(mock_chunks)
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, [
-                '--stream',
-                '-t', '0.9',
-                'Test prompt'
-            ])
-
-            assert result.exit_code == 0
-            call_args = mock_client.chat_completion.call_args[1]
-            assert call_args['temperature'] == 0.9
-            assert call_args['stream'] is True
-
-    def test_cli_max_tokens_with_streaming(self, runner):
-        """Test max_tokens parameter works with streaming."""
-        mock_chunks = ["Test"]
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = iter(mock_chunks)
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, [
-                '--stream',
-                '-mt', '100',
-                'Test prompt'
-            ])
-
-            assert result.exit_code == 0
-            call_args = mock_client.chat_completion.call_args[1]
-            assert call_args['max_tokens'] == 100
-            assert call_args['stream'] is True
+    @pytest.mark.parametrize("args,expected", [
+        (ARGS_NO_STREAM, {'temperature': 0.7, 'max_tokens': 2048}),
+        (('--no-stream', '-t', '0.5', 'Test prompt'), {'temperature': 0.5}),
+        (('--no-stream', '--temperature', '1.2', 'Test prompt'), {'temperature': 1.2}),
+        (('--no-stream', '-mt', '1024', 'Test prompt'), {'max_tokens': 1024}),
+        (('--no-stream', '--max-tokens', '512', 'Test prompt'), {'max_tokens': 512}),
+        (('--no-stream', '-t', '0.3', '-mt', '256', 'Test prompt'),
+         {'temperature': 0.3, 'max_tokens': 256}),
+    ])
+    def test_cli_sampling_parameters(self, fake_client, args, expected):
+        """Test that sampling flags (and their defaults) reach chat_completion."""
+        _invoke_fast(args)
+
+        for key, value in expected.items():
+            assert fake_client.last_kwargs[key] == value
+
+    @pytest.mark.parametrize("args,expected", [
+        (('--stream', '-t', '0.9', 'Test prompt'), {'temperature': 0.9}),
+        (('--stream', '-mt', '100', 'Test prompt'), {'max_tokens': 100}),
+    ])
+    def test_cli_sampling_parameters_with_streaming(self, runner, mock_client, args, expected):
+        """Test that sampling flags work together with streaming."""
+        mock_client.chat_completion.return_value = iter(_STREAM_HELLO)
+
+        result = runner.invoke(cli, args)
+
+        assert result.exit_code == 0
+        call_args = mock_client.chat_completion.call_args[1]
+        assert call_args['stream'] is True
+        for key, value in expected.items():
+            assert call_args[key] == value
 
 
 class TestCLIModelSelection:
     """Tests for model selection."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI test runner."""
-        return CliRunner()
-
-    def test_cli_default_model(self, runner):
-        """Test that default model is Hermes-4-405B."""
-        mock_response = {
-            "choices": [{"message": {"content": "Response"}}]
-        }
+    @pytest.mark.parametrize("args,expected_model", [
+        (ARGS_NO_STREAM, 'Hermes-4-405B'),
+        (('--no-stream', '-m', 'Hermes-4-70B', 'Test prompt'), 'Hermes-4-70B'),
+    ])
+    def test_cli_model_selection(self, fake_client, args, expected_model):
+        """Test that the default and explicit model flags are forwarded."""
+        _invoke_fast(args)
 
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, ['--no-stream', 'Test'])
-
-            assert result.exit_code == 0
-            call_args = mock_client.chat_completion.call_args[1]
-            assert call_args['model'] == 'Hermes-4-405B'
-
-    def test_cli_with_hermes_70b_model(self, runner):
-        """Test CLI with Hermes-4-70B model."""
-        mock_response = {
-            "choices": [{"message": {"content": "Response"}}]
-        }
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, [
-                '--no-stream',
-                '-m', 'Hermes-4-70B',
-                'Test prompt'
-            ])
-
-            assert result.exit_code == 0
-            call_args = mock_client.chat_completion.call_args[1]
-            assert call_args['model'] == 'Hermes-4-70B'
+        assert fake_client.last_kwargs['model'] == expected_model
 
 
 class TestCLIStreaming:
     """Tests for streaming functionality."""
-
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI test runner."""
-        return CliRunner()
-
-    def test_cli_streaming_output(self, runner):
+    def test_cli_streaming_output(self, runner, mock_client):
         """Test CLI with streaming enabled."""
-        mock_chunks = ["Hello", " ", "world"]
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = iter(mock_chunks)
-            mock_client_class.return_value = mock_client
+        mock_client.chat_completion.return_value = iter(_STREAM_HELLO_WORLD)
 
-            result = runner.invoke(cli, ['--stream', 'Test prompt'])
+        result = runner.invoke(cli, ('--stream', 'Test prompt'))
 
-            assert result.exit_code == 0
-            assert "Hello world" in result.output
+        assert result.exit_code == 0
+        assert b"Hello world" in result.output_bytes
 
-    def test_cli_non_streaming_output(self, runner):
+    def test_cli_non_streaming_output(self, runner, mock_client):
         """Test CLI with streaming disabled."""
-        mock_response = {
-            "choices": [{"message": {"content": "Complete response"}}]
-        }
+        mock_client.chat_completion.return_value = _RESP_COMPLETE
 
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
+        result = runner.invoke(cli, ARGS_NO_STREAM_PROMPT)
 
-            result = runner.invoke(cli, ['--no-stream', 'Test prompt'])
-
-            assert result.exit_code == 0
-            assert "Complete response" in result.output
+        assert result.exit_code == 0
+        assert b"Complete response" in result.output_bytes
 
 
 class TestCLIErrorHandling:
     """Tests for CLI error handling."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI test runner."""
-        return CliRunner()
-
-    def test_cli_missing_api_key(self, runner):
-        """Test CLI handles missing API key error."""
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client_class.side_effect = ValueError("API key not found")
-
-            result = runner.invoke(cli, ['--no-stream', 'Test'])
-
-            assert result.exit_code == 1
-            assert "API key not found" in result.output
-
-    def test_cli_api_error(self, runner):
-        """Test CLI handles API errors."""
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.side_effect = APIError("API failed")
-            mock_client_class.return_value = mock_client
+    @pytest.mark.parametrize("target,exc,exit_code,msg", [
+        ("class", ValueError("API key not found"), 1, "API key not found"),
+        ("method", APIError("API failed"), 1, "API Error"),
+        ("method", KeyboardInterrupt(), 130, "Interrupted"),
+    ])
+    def test_cli_error_handling(self, runner, mock_client_class, mock_client,
+                                target, exc, exit_code, msg):
+        """Test exit codes and messages for constructor and request failures."""
+        if target == "class":
+            mock_client_class.side_effect = exc
+        else:
+            mock_client.chat_completion.side_effect = exc
 
-            result = runner.invoke(cli, ['--no-stream', 'Test'])
+        result = runner.invoke(cli, ARGS_NO_STREAM)
 
-            assert result.exit_code == 1
-            assert "API Error" in result.output
-
-    def test_cli_keyboard_interrupt(self, runner):
-        """Test CLI handles keyboard interrupt gracefully."""
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.side_effect = KeyboardInterrupt()
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, ['--no-stream', 'Test'])
-
-            assert result.exit_code == 130
-            assert "Interrupted" in result.output
+        assert result.exit_code == exit_code
+        assert msg.encode() in result.output_bytes
 
 
 class TestCLISchema:
     """Tests for schema functionality."""
+    def test_cli_with_schema_json_output(self, runner, mock_client):
+        """Test CLI with schema produces JSON output."""
+        mock_client.chat_completion.return_value = _response('{"answer": "42"}')
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI test runner."""
-        return CliRunner()
+        result = runner.invoke(cli, (
+            '--schema', _SCHEMA_ANSWER,
+            'Test prompt'
+        ))
 
-    def test_cli_with_schema_json_output(self, runner):
-        """Test CLI with schema produces JSON output."""
-        json_response = '{"answer": "42"}'
-        mock_response = {
-            "choices": [{"message": {"content": json_response}}]
-        }
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            schema = '{"type": "object", "properties": {"answer": {"type": "string"}}}'
-            result = runner.invoke(cli, [
-                '--schema', schema,
-                'Test prompt'
-            ])
-
-            assert result.exit_code == 0
-            # Should pretty-print JSON
-            assert '"answer"' in result.output
-            assert '"42"' in result.output
-
-    def test_cli_schema_disables_streaming_by_default(self, runner):
-        """Test that schema disables streaming by default."""
-        mock_response = {
-            "choices": [{"message": {"content": '{"result": "test"}'}}]
-        }
+        assert result.exit_code == 0
+        # Should pretty-print JSON
+        assert b'"answer"' in result.output_bytes
+        assert b'"42"' in result.output_bytes
 
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
+    def test_cli_schema_disables_streaming_by_default(self, runner, mock_client):
+        """Test that schema disables streaming by default."""
+        mock_client.chat_completion.return_value = _response('{"result": "test"}')
 
-            schema = '{"type": "object"}'
-            result = runner.invoke(cli, [
-                '--schema', schema,
-                'Test prompt'
-            ])
+        result = runner.invoke(cli, (
+            '--schema', _SCHEMA_MIN,
+            'Test prompt'
+        ))
 
-            assert result.exit_code == 0
-            call_args = mock_client.chat_completion.call_args[1]
-            assert call_args['stream'] is False
+        assert result.exit_code == 0
+        call_args = mock_client.chat_completion.call_args[1]
+        assert call_args['stream'] is False
 
 
 class TestCLIBorder:
     """Tests for border formatting functionality."""
+    def test_cli_with_border_non_streaming(self, runner, mock_client):
+        """Test CLI with border flag for non-streaming output."""
+        mock_client.chat_completion.return_value = _RESP_TEST
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI test runner."""
-        return CliRunner()
+        result = runner.invoke(cli, (
+            '--no-stream',
+            '--border',
+            'Test prompt'
+        ))
 
-    def test_cli_with_border_non_streaming(self, runner):
-        """Test CLI with border flag for non-streaming output."""
-        mock_response = {
-            "choices": [{"message": {"content": "Test response"}}]
-        }
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, [
-                '--no-stream',
-                '--border',
-                'Test prompt'
-            ])
-
-            assert result.exit_code == 0
-            # Check for border characters from rich Panel
-            assert "Hermes-4-405B" in result.output
-            assert "Test response" in result.output
-
-    def test_cli_with_border_streaming(self, runner):
-        """Test CLI with border flag for streaming output."""
-        mock_chunks = ["Hello", " ", "world"]
+        assert result.exit_code == 0
+        # Check for border characters from rich Panel
+        assert b"Hermes-4-405B" in result.output_bytes
+        assert b"Test response" in result.output_bytes
 
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = iter(mock_chunks)
-            mock_client_class.return_value = mock_client
+    def test_cli_with_border_streaming(self, runner, mock_client):
+        """Test CLI with border flag for streaming output."""
+        mock_client.chat_completion.return_value = iter(_STREAM_HELLO_WORLD)
 
-            result = runner.invoke(cli, [
-                '--stream',
-                '--border',
-                'Test prompt'
-            ])
+        result = runner.invoke(cli, (
+            '--stream',
+            '--border',
+            'Test prompt'
+        ))
 
-            assert result.exit_code == 0
-            # Check for border characters and collected output
-            assert "Hermes-4-405B" in result.output
-            assert "Hello world" in result.output
+        assert result.exit_code == 0
+        # Check for border characters and collected output
+        assert b"Hermes-4-405B" in result.output_bytes
+        assert b"Hello world" in result.output_bytes
 
-    def test_cli_without_border(self, runner):
+    def test_cli_without_border(self, runner, mock_client):
         """Test CLI output without border flag (default behavior)."""
-        mock_response = {
-            "choices": [{"message": {"content": "Test response"}}]
-        }
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, [
-                '--no-stream',
-                'Test prompt'
-            ])
-
-            assert result.exit_code == 0
-            # Should NOT have border formatting
-            assert "Hermes-4-405B" not in result.output
-            # Should have plain output
-            assert result.output.strip() == "Test response"
-
-    def test_cli_border_with_schema(self, runner):
+        mock_client.chat_completion.return_value = _RESP_TEST
+
+        result = runner.invoke(cli, [
+            '--no-stream',
+            'Test prompt'
+        ])
+
+        assert result.exit_code == 0
+        # Should NOT have border formatting
+        assert b"Hermes-4-405B" not in result.output_bytes
+        # Should have plain output
+        assert result.output_bytes.strip() == b"Test response"
+
+    def test_cli_border_with_schema(self, runner, mock_client):
         """Test CLI with both border and schema flags."""
-        json_response = '{"answer": "42"}'
-        mock_response = {
-            "choices": [{"message": {"content": json_response}}]
-        }
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            schema = '{"type": "object", "properties": {"answer": {"type": "string"}}}'
-            result = runner.invoke(cli, [
-                '--schema', schema,
-                '--border',
-                'Test prompt'
-            ])
-
-            assert result.exit_code == 0
-            # Should have border
-            assert "Hermes-4-405B" in result.output
-            # Should have pretty-printed JSON
-            assert '"answer"' in result.output
-            assert '"42"' in result.output
-
-    def test_cli_border_with_multiline_content(self, runner):
+        mock_client.chat_completion.return_value = _response('{"answer": "42"}')
+
+        result = runner.invoke(cli, (
+            '--schema', _SCHEMA_ANSWER,
+            '--border',
+            'Test prompt'
+        ))
+
+        assert result.exit_code == 0
+        # Should have border
+        assert b"Hermes-4-405B" in result.output_bytes
+        # Should have pretty-printed JSON
+        assert b'"answer"' in result.output_bytes
+        assert b'"42"' in result.output_bytes
+
+    def test_cli_border_with_multiline_content(self, runner, mock_client):
         """Test CLI with border flag for multiline content."""
-        multiline_content = "Line 1\nLine 2\nLine 3"
-        mock_response = {
-            "choices": [{"message": {"content": multiline_content}}]
-        }
-
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.chat_completion.return_value = mock_response
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(cli, [
-                '--no-stream',
-                '--border',
-                'Test prompt'
-            ])
-
-            assert result.exit_code == 0
-            # Check that all lines are present
-            assert "Line 1" in result.output
-            assert "Line 2" in result.output
-            assert "Line 3" in result.output
-            assert "Hermes-4-405B" in result.output
+        mock_client.chat_completion.return_value = _response("Line 1\nLine 2\nLine 3")
+
+        result = runner.invoke(cli, (
+            '--no-stream',
+            '--border',
+            'Test prompt'
+        ))
+
+        assert result.exit_code == 0
+        # Check that all lines are present
+        assert b"Line 1" in result.output_bytes
+        assert b"Line 2" in result.output_bytes
+        assert b"Line 3" in result.output_bytes
+        assert b"Hermes-4-405B" in result.output_bytes
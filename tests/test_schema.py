@@ -1,9 +1,10 @@
 """Tests for schema handling."""
 
+import io
 import json
+import os
 import pytest
-from pathlib import Path
-from unittest.mock import patch, mock_open
+import hermes_cli.schema
 from hermes_cli.schema import (
     is_json_string,
     validate_schema_structure,
@@ -13,77 +14,57 @@ from hermes_cli.schema import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_schema_caches():
+    """Clear load_schema's caches so tests stay independent.
+
+    Several tests reuse the same schema text or reuse tmp file names
+    across cases; clearing between tests keeps each one exercising a
+    cold parse rather than a cache hit from a neighbour.
+    """
+    yield
+    hermes_cli.schema._parse_schema_string.cache_clear()
+    hermes_cli.schema._load_schema_file.cache_clear()
+
+
 class TestIsJsonString:
     """Tests for is_json_string function."""
 
-    def test_identifies_json_object(self):
-        """Test that JSON objects starting with { are identified."""
-        assert is_json_string('{"type": "object"}') is True
-        assert is_json_string(' {"type": "object"}') is True
-        assert is_json_string('\n{"type": "object"}') is True
-
-    def test_identifies_json_array(self):
-        """Test that JSON arrays starting with [ are identified."""
-        assert is_json_string('[1, 2, 3]') is True
-        assert is_json_string(' [1, 2, 3]') is True
-        assert is_json_string('\n[{"type": "string"}]') is True
-
-    def test_identifies_file_paths(self):
-        """Test that file paths are correctly identified as not JSON."""
-        assert is_json_string('schema.json') is False
-        assert is_json_string('./schemas/response.json') is False
-        assert is_json_string('/path/to/schema.json') is False
-        assert is_json_string('~/config/schema.json') is False
-
-    def test_handles_whitespace(self):
-        """Test proper handling of whitespace."""
-        assert is_json_string('   {"key": "value"}') is True
-        assert is_json_string('\t\n{"key": "value"}') is True
-        assert is_json_string('   file.json') is False
-
-    def test_edge_cases(self):
-        """Test edge cases."""
-        assert is_json_string('') is False
-        assert is_json_string('   ') is False
-        assert is_json_string('not-json-or-path') is False
+    @pytest.mark.parametrize("input_str,expected", [
+        # JSON objects, with and without leading whitespace
+        ('{"type": "object"}', True),
+        (' {"type": "object"}', True),
+        ('\n{"type": "object"}', True),
+        ('   {"key": "value"}', True),
+        ('\t\n{"key": "value"}', True),
+        # JSON arrays
+        ('[1, 2, 3]', True),
+        (' [1, 2, 3]', True),
+        ('\n[{"type": "string"}]', True),
+        # File paths
+        ('schema.json', False),
+        ('./schemas/response.json', False),
+        ('/path/to/schema.json', False),
+        ('~/config/schema.json', False),
+        ('   file.json', False),
+        # Edge cases
+        ('', False),
+        ('   ', False),
+        ('not-json-or-path', False),
+    ])
+    def test_is_json_string(self, input_str, expected):
+        """Test JSON-vs-path classification across representative inputs."""
+        assert is_json_string(input_str) is expected
 
 
 class TestValidateSchemaStructure:
     """Tests for validate_schema_structure function."""
 
-    def test_valid_schema_with_type(self):
-        """Test validation of valid schema with type field."""
-        schema = {"type": "object", "properties": {}}
-        validate_schema_structure(schema)  # Should not raise
-
-    def test_valid_schema_without_type(self):
-        """Test validation of schema without type field (allowed)."""
-        schema = {"properties": {"name": {"type": "string"}}}
-        validate_schema_structure(schema)  # Should not raise
-
-    def test_empty_schema_raises_error(self):
-        """Test that empty schema raises ValueError."""
-        with pytest.raises(ValueError) as exc_info:
-            validate_schema_structure({})
-        assert "cannot be empty" in str(exc_info.value)
-
-    def test_non_dict_schema_raises_error(self):
-        """Test that non-dictionary schemas raise ValueError."""
-        with pytest.raises(ValueError) as exc_info:
-            validate_schema_structure([])
-        assert "must be a JSON object" in str(exc_info.value)
-
-        with pytest.raises(ValueError) as exc_info:
-            validate_schema_structure("string")
-        assert "must be a JSON object" in str(exc_info.value)
-
-        with pytest.raises(ValueError) as exc_info:
-            validate_schema_structure(None)
-        assert "must be a JSON object" in str(exc_info.value)
-
-    def test_complex_valid_schema(self):
-        """Test validation of complex valid schema."""
-        schema = {
+    @pytest.mark.parametrize("schema", [
+        {"type": "object", "properties": {}},
+        # Missing root-level type is allowed
+        {"properties": {"name": {"type": "string"}}},
+        {
             "type": "object",
             "properties": {
                 "name": {"type": "string"},
@@ -91,9 +72,24 @@ class TestValidateSchemaStructure:
                 "email": {"type": "string", "format": "email"}
             },
             "required": ["name", "email"]
-        }
+        },
+    ])
+    def test_valid_schemas(self, schema):
+        """Test that structurally valid schemas pass without raising."""
         validate_schema_structure(schema)  # Should not raise
 
+    @pytest.mark.parametrize("schema,message", [
+        ({}, "cannot be empty"),
+        ([], "must be a JSON object"),
+        ("string", "must be a JSON object"),
+        (None, "must be a JSON object"),
+    ])
+    def test_invalid_schemas_raise_error(self, schema, message):
+        """Test that empty and non-dict schemas raise ValueError."""
+        with pytest.raises(ValueError) as exc_info:
+            validate_schema_structure(schema)
+        assert message in str(exc_info.value)
+
 
 class TestLoadSchema:
     """Tests for load_schema function."""
@@ -141,15 +137,11 @@ class TestLoadSchema:
         schema_file = tmp_path / "schema.json"
         schema_file.write_text(json.dumps(schema_content))
 
-        # Mock expanduser to return our tmp_path
-        def mock_expanduser(self):
-            if str(self).startswith("~"):
-                return tmp_path / str(self)[2:]  # Remove ~/ prefix
-            return self
-
-        with patch.object(Path, 'expanduser', mock_expanduser):
-            schema = load_schema("~/schema.json")
-            assert schema == schema_content
+        # Point HOME at tmp_path so ~ resolves there naturally, without
+        # patching expanduser itself
+        monkeypatch.setenv("HOME", str(tmp_path))
+        schema = load_schema("~/schema.json")
+        assert schema == schema_content
 
     def test_load_schema_file_not_found(self):
         """Test error handling when schema file doesn't exist."""
@@ -171,13 +163,12 @@ class TestLoadSchema:
         assert "Invalid JSON" in error_msg
         assert "Example:" in error_msg
 
-    def test_load_schema_invalid_json_in_file(self, tmp_path):
+    def test_load_schema_invalid_json_in_file(self):
         """Test error handling for invalid JSON in file."""
-        schema_file = tmp_path / "bad_schema.json"
-        schema_file.write_text('{"type": "object", invalid}')
+        blob = b'{"type": "object", invalid}'
 
         with pytest.raises(ValueError) as exc_info:
-            load_schema(str(schema_file))
+            load_schema("bad_schema.json", _opener=lambda p: io.BytesIO(blob))
 
         error_msg = str(exc_info.value)
         assert "Invalid JSON in schema file" in error_msg
@@ -249,7 +240,7 @@ class TestLoadSchema:
 
         assert schema == complex_schema
 
-    def test_load_schema_with_unicode(self, tmp_path):
+    def test_load_schema_with_unicode(self):
         """Test loading schema with unicode characters."""
         schema_content = {
             "type": "object",
@@ -257,10 +248,9 @@ class TestLoadSchema:
                 "message": {"type": "string", "description": "Hello 世界 🌍"}
             }
         }
-        schema_file = tmp_path / "unicode_schema.json"
-        schema_file.write_text(json.dumps(schema_content, ensure_ascii=False), encoding='utf-8')
+        blob = json.dumps(schema_content, ensure_ascii=False).encode('utf-8')
 
-        schema = load_schema(str(schema_file))
+        schema = load_schema("unicode_schema.json", _opener=lambda p: io.BytesIO(blob))
 
         assert schema == schema_content
         assert "Hello 世界 🌍" in schema["properties"]["message"]["description"]
@@ -401,56 +391,48 @@ class TestBuildSystemPromptWithSchema:
 class TestShouldDisableStreaming:
     """Tests for should_disable_streaming function."""
 
-    def test_disable_streaming_when_schema_provided(self):
-        """Test that streaming is disabled when schema is provided."""
-        schema = {"type": "object", "properties": {}}
-        assert should_disable_streaming(schema) is True
-
-    def test_enable_streaming_when_no_schema(self):
-        """Test that streaming is enabled when no schema is provided."""
-        assert should_disable_streaming(None) is False
-
-    def test_disable_streaming_with_complex_schema(self):
-        """Test streaming disabled with complex schema."""
-        schema = {
+    @pytest.mark.parametrize("schema,expected", [
+        ({"type": "object", "properties": {}}, True),
+        (None, False),
+        ({
             "type": "object",
             "properties": {
                 "data": {"type": "array", "items": {"type": "string"}}
             }
-        }
-        assert should_disable_streaming(schema) is True
+        }, True),
+        ({"type": "string"}, True),
+        # Empty dict is still a schema object, so should disable streaming
+        ({}, True),
+    ])
+    def test_should_disable_streaming(self, schema, expected):
+        """Test that streaming is disabled exactly when a schema is given."""
+        assert should_disable_streaming(schema) is expected
 
-    def test_disable_streaming_with_simple_schema(self):
-        """Test streaming disabled even with simple schema."""
-        schema = {"type": "string"}
-        assert should_disable_streaming(schema) is True
 
-    def test_disable_streaming_with_empty_schema(self):
-        """Test streaming disabled even with empty dict (though invalid)."""
-        # Empty dict is still a schema object, so should disable streaming
-        schema = {}
-        assert should_disable_streaming(schema) is True
+@pytest.fixture(scope="module")
+def sample_schema():
+    """Load the shared sample schema once for the whole module.
+
+    The full-flow tests all start from the same schema string; parsing
+    it once lets each test focus on the step it actually exercises.
+    """
+    return load_schema('{"type": "object", "properties": {"answer": {"type": "string"}}}')
 
 
 class TestIntegration:
     """Integration tests combining multiple schema functions."""
 
-    def test_full_flow_json_string_to_system_prompt(self):
+    def test_full_flow_json_string_to_system_prompt(self, sample_schema):
         """Test full flow from JSON string to system prompt."""
-        json_string = '{"type": "object", "properties": {"answer": {"type": "string"}}}'
         user_prompt = "Be helpful"
 
-        # Load schema
-        schema = load_schema(json_string)
-        assert schema is not None
-
         # Build system prompt
-        system_prompt = build_system_prompt_with_schema(user_prompt, schema)
+        system_prompt = build_system_prompt_with_schema(user_prompt, sample_schema)
         assert user_prompt in system_prompt
         assert "valid JSON" in system_prompt
 
         # Check streaming
-        assert should_disable_streaming(schema) is True
+        assert should_disable_streaming(sample_schema) is True
 
     def test_full_flow_file_to_system_prompt(self, tmp_path):
         """Test full flow from file to system prompt."""
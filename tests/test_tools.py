@@ -3,7 +3,7 @@
 import pytest
 import json
 from unittest.mock import Mock, patch
-from hermes_cli.tools import ToolRegistry, ToolExecutor, tool
+from hermes_cli.tools import ToolExecutor, tool
 from hermes_cli.builtin_tools import calculate, read_file, write_file, execute_shell_command
 
 
@@ -35,9 +35,9 @@ def test_calculate_tool():
     assert "error" in result
 
 
-def test_tool_registry_initialization():
+def test_tool_registry_initialization(shared_registry):
     """Test ToolRegistry loads built-in tools."""
-    registry = ToolRegistry()
+    registry = shared_registry
     assert "calculate" in registry.tools
     assert "execute_shell_command" in registry.tools
     assert "read_file" in registry.tools
@@ -45,9 +45,9 @@ def test_tool_registry_initialization():
     assert "web_search" in registry.tools
 
 
-def test_tool_selection():
+def test_tool_selection(shared_registry):
     """Test tool selection logic."""
-    registry = ToolRegistry()
+    registry = shared_registry
 
     # Select specific tool
     selected = registry.select_tools("calculate")
@@ -65,17 +65,17 @@ def test_tool_selection():
     assert len(selected) >= 5  # At least 5 built-in tools
 
 
-def test_tool_selection_unknown_tool():
+def test_tool_selection_unknown_tool(shared_registry):
     """Test error on unknown tool."""
-    registry = ToolRegistry()
+    registry = shared_registry
 
     with pytest.raises(ValueError, match="Unknown tool"):
         registry.select_tools("nonexistent")
 
 
-def test_get_tool_schemas():
+def test_get_tool_schemas(shared_registry):
     """Test schema generation."""
-    registry = ToolRegistry()
+    registry = shared_registry
     selected = registry.select_tools("calculate")
     schemas = registry.get_tool_schemas(selected)
 
@@ -85,9 +85,9 @@ def test_get_tool_schemas():
     assert "parameters" in schemas[0]["function"]
 
 
-def test_list_tools():
+def test_list_tools(shared_registry):
     """Test listing all tools."""
-    registry = ToolRegistry()
+    registry = shared_registry
     available = registry.list_tools()
 
     assert "builtin" in available
@@ -96,9 +96,9 @@ def test_list_tools():
     assert len(available["builtin"]) >= 5
 
 
-def test_get_tool_info():
+def test_get_tool_info(shared_registry):
     """Test getting tool info."""
-    registry = ToolRegistry()
+    registry = shared_registry
     info = registry.get_tool_info("calculate")
 
     assert info["name"] == "calculate"
@@ -107,17 +107,17 @@ def test_get_tool_info():
     assert "parameters" in info
 
 
-def test_get_tool_info_unknown():
+def test_get_tool_info_unknown(shared_registry):
     """Test error on unknown tool info."""
-    registry = ToolRegistry()
+    registry = shared_registry
 
     with pytest.raises(ValueError, match="Tool not found"):
         registry.get_tool_info("nonexistent")
 
 
-def test_tool_executor():
+def test_tool_executor(shared_registry):
     """Test ToolExecutor execution."""
-    registry = ToolRegistry()
+    registry = shared_registry
     selected = registry.select_tools("calculate")
     executor = ToolExecutor(registry)
 
@@ -142,9 +142,9 @@ def test_tool_executor():
     assert content["result"] == 8
 
 
-def test_tool_executor_invalid_args():
+def test_tool_executor_invalid_args(shared_registry):
     """Test ToolExecutor handles invalid arguments."""
-    registry = ToolRegistry()
+    registry = shared_registry
     selected = registry.select_tools("calculate")
     executor = ToolExecutor(registry)
 
@@ -161,9 +161,9 @@ def test_tool_executor_invalid_args():
     assert "error" in result["content"]
 
 
-def test_tool_executor_multiple_calls():
+def test_tool_executor_multiple_calls(shared_registry):
     """Test executing multiple tool calls."""
-    registry = ToolRegistry()
+    registry = shared_registry
     selected = registry.select_tools("calculate")
     executor = ToolExecutor(registry)
 
@@ -208,17 +208,8 @@ def test_execute_shell_command(mock_run):
     mock_run.assert_called_once()
 
 
-@patch('pathlib.Path.read_text')
-@patch('pathlib.Path.exists')
-@patch('pathlib.Path.is_file')
-@patch('pathlib.Path.stat')
-def test_read_file_tool(mock_stat, mock_is_file, mock_exists, mock_read_text):
+def test_read_file_tool(fake_path):
     """Test read_file tool."""
-    mock_exists.return_value = True
-    mock_is_file.return_value = True
-    mock_stat.return_value = Mock(st_size=100)
-    mock_read_text.return_value = "file content"
-
     result = read_file(file_path="/tmp/test.txt")
 
     assert result["content"] == "file content"
@@ -230,14 +221,12 @@ def test_read_file_not_found():
     assert "error" in result
 
 
-@patch('pathlib.Path.write_text')
-@patch('pathlib.Path.mkdir')
-def test_write_file_tool(mock_mkdir, mock_write_text):
+def test_write_file_tool(fake_path):
     """Test write_file tool."""
     result = write_file(file_path="/tmp/test.txt", content="test content")
 
     assert result["success"] is True
-    mock_write_text.assert_called_once_with("test content", encoding='utf-8')
+    assert fake_path.written == ("test content", 'utf-8')
 
 
 @patch('requests.get')
@@ -299,48 +288,17 @@ def test_custom_tool_decorator():
     assert result["result"] == "processed: test"
 
 
-@patch('hermes_cli.api.NousAPIClient')
-def test_chat_command_with_tools(mock_client_class):
+def test_chat_command_with_tools(fake_nous_client):
     """Test chat command accepts --use-tools flag."""
     from click.testing import CliRunner
     from hermes_cli.main import cli
     import uuid
 
-    # Mock the API client
-    mock_client = Mock()
-    mock_client_class.return_value = mock_client
-
-    # Mock API response with tool call followed by final answer
-    mock_client.chat_completion.side_effect = [
-        # First response: tool call
-        {
-            "choices": [{
-                "finish_reason": "tool_calls",
-                "message": {
-                    "role": "assistant",
-                    "content": None,
-                    "tool_calls": [{
-                        "id": "call_123",
-                        "type": "function",
-                        "function": {
-                            "name": "calculate",
-                            "arguments": '{"expression": "2 + 2"}'
-                        }
-                    }]
-                }
-            }]
-        },
-        # Second response: final answer
-        {
-            "choices": [{
-                "finish_reason": "stop",
-                "message": {
-                    "role": "assistant",
-                    "content": "The answer is 4."
-                }
-            }]
-        }
-    ]
+    # Queue a tool call followed by the final answer
+    fake_nous_client.responses = (
+        fake_nous_client.TOOL_CALL_RESPONSE,
+        fake_nous_client.FINAL_RESPONSE,
+    )
 
     runner = CliRunner()
     with runner.isolated_filesystem():
@@ -362,43 +320,28 @@ def test_chat_command_with_tools(mock_client_class):
         assert "[Calling tool: calculate]" in result.output or result.exit_code == 0
 
 
-def test_chat_command_with_tools_and_max_calls():
-    """Test chat command accepts --max-tool-calls flag."""
-    from click.testing import CliRunner
-    from hermes_cli.main import cli
-    import uuid
-    from unittest.mock import patch, Mock, MagicMock
-
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Use unique conversation name to avoid conflicts
-        chat_name = f'test-max-calls-{uuid.uuid4().hex[:8]}'
-
-        # Patch before invoking
-        with patch('hermes_cli.main.NousAPIClient') as mock_client_class:
-            # Create a completely fresh mock
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
-
-            # Mock API response - fresh mock won't have side_effect
-            mock_client.chat_completion.return_value = {
-                "choices": [{
-                    "finish_reason": "stop",
-                    "message": {
-                        "role": "assistant",
-                        "content": "Answer"
-                    }
-                }]
-            }
+def test_chat_command_with_tools_and_max_calls(fake_nous_client, monkeypatch, tmp_path, capsys):
+    """Test chat command tool options via a direct callback call."""
+    import io
+    import sys
+    import click
+    from hermes_cli.main import chat
+
+    # Skip CliRunner entirely: invoke the command function with keyword
+    # args (Context.invoke fills in the option defaults). Flag *parsing*
+    # stays covered by the CliRunner test above. Conversations live
+    # under ~/, so point HOME at a scratch dir, and give read_stdin an
+    # empty non-tty stdin as CliRunner would.
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(), encoding="utf-8"))
+
+    ctx = click.Context(chat, obj={})
+    ctx.invoke(
+        chat,
+        prompt='Test prompt',
+        name='test-max-calls',
+        use_tools='calculate',
+        max_tool_calls=10,
+    )
 
-            result = runner.invoke(cli, [
-                'chat',
-                '--name', chat_name,
-                '--use-tools', 'calculate',
-                '--max-tool-calls', '10',
-                'Test prompt'
-            ])
-
-            # Should not error on flags
-            assert result.exit_code == 0, f"Command failed: {result.output}\nException: {getattr(result, 'exception', None)}"
-            assert "No such option" not in result.output
+    assert "The answer is 4." in capsys.readouterr().out